@@ -0,0 +1,25 @@
+"""Shared helper for design scripts that render through headless Chrome.
+
+Both gen_neight_icon.py and gen_social_preview.py carried identical copies of
+the Chrome discovery logic; keep the single source of truth here.
+"""
+
+import functools
+import shutil
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=1)
+def find_chrome() -> str:
+    candidates = [
+        shutil.which("google-chrome"),
+        shutil.which("chromium"),
+        shutil.which("chromium-browser"),
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+        str(Path.home() / "Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
+    ]
+    for c in candidates:
+        if c and Path(c).exists():
+            return c
+    raise RuntimeError("Chrome/Chromium not found. Install Google Chrome or ensure it is on PATH.")
@@ -35,6 +35,10 @@ def load_source_icon() -> Image.Image:
 
 def render(source: Image.Image, canvas_w: int, canvas_h: int, logo_size: int) -> Image.Image:
     logo = source.resize((logo_size, logo_size), Image.LANCZOS)
+    if (canvas_w, canvas_h) == (logo_size, logo_size):
+        # Logo fills the canvas (every square asset) — the transparent canvas
+        # plus centred paste would be a full-image composite for nothing.
+        return logo
     canvas = Image.new("RGBA", (canvas_w, canvas_h), (0, 0, 0, 0))
     x = (canvas_w - logo_size) // 2
     y = (canvas_h - logo_size) // 2
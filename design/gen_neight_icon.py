@@ -7,29 +7,13 @@ ICNS → full-square fill, no pre-rounding       (macOS applies squircle mask)
 """
 
 import io, struct, subprocess, shutil, tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
-ROOT = Path(__file__).resolve().parent.parent   # project root (parent of design/)
-WORK = Path(tempfile.mkdtemp(prefix="neight_icon_"))
-
-
-def _find_chrome() -> str:
-    candidates = [
-        shutil.which("google-chrome"),
-        shutil.which("chromium"),
-        shutil.which("chromium-browser"),
-        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-        "/Applications/Chromium.app/Contents/MacOS/Chromium",
-        str(Path.home() / "Applications/Google Chrome.app/Contents/MacOS/Google Chrome"),
-    ]
-    for c in candidates:
-        if c and Path(c).exists():
-            return c
-    raise RuntimeError("Chrome/Chromium not found. Install Google Chrome or ensure it is on PATH.")
-
+from _chrome import find_chrome
 
-CHROME = _find_chrome()
+ROOT = Path(__file__).resolve().parent.parent   # project root (parent of design/)
 
 # ── SVG templates ─────────────────────────────────────────────────────────
 
@@ -65,13 +49,13 @@ body{{width:{size}px;height:{size}px;overflow:hidden;background:transparent;}}
 </body></html>"""
 
 
-def render(size: int, rounded: bool) -> Image.Image:
+def render(chrome: str, work: Path, size: int, rounded: bool) -> Image.Image:
     tag      = "r" if rounded else "s"
-    html_p   = WORK / f"_tmp_{tag}_{size}.html"
-    png_p    = WORK / f"_tmp_{tag}_{size}.png"
+    html_p   = work / f"_tmp_{tag}_{size}.html"
+    png_p    = work / f"_tmp_{tag}_{size}.png"
     html_p.write_text(_body(size, rounded), encoding="utf-8")
     subprocess.run(
-        [CHROME, "--headless=new",
+        [chrome, "--headless=new",
          f"--screenshot={png_p}",
          f"--window-size={size},{size}",
          "--no-sandbox", "--disable-gpu", "--hide-scrollbars",
@@ -101,26 +85,51 @@ ICNS_SPEC = {                          # filename → pixel dimension
     "icon_512x512@2x.png": 1024,
 }
 
-# ── Render ────────────────────────────────────────────────────────────────
 
-ico_sizes_set  = set(ICO_SIZES)
-icns_sizes_set = set(ICNS_SPEC.values())
-all_sizes      = sorted(ico_sizes_set | icns_sizes_set)
+# Chrome start-up dominates the cost of render(), so launch it only once per
+# variant: render at the largest size needed, then Lanczos-downscale for the
+# rest.  The SVG scales with its viewBox, so a downscaled large render matches
+# a native render at the small size (minus Chrome's own per-size antialiasing).
+
+
+def lanczos_pyramid(master: Image.Image, sizes: set) -> dict:
+    """Downscale ``master`` to every size, largest first, as a mipmap chain.
+
+    Each size is resampled from the smallest already-built image that is at
+    least twice the target, not always from the master: Lanczos then runs over
+    far fewer source pixels for the tiny sizes, and a ≥2× shrink per step keeps
+    the kernel well-conditioned (a 1024→16 single jump averages 64×64 blocks).
+    """
+    out = {}
+    for s in sorted(sizes, reverse=True):
+        if s == master.width:
+            out[s] = master
+            continue
+        source = min(
+            (im for im in [master, *out.values()] if im.width >= 2 * s),
+            key=lambda im: im.width,
+            default=master,  # a size in (master/2, master): shrink < 2× is fine
+        )
+        out[s] = source.resize((s, s), Image.LANCZOS)
+    return out
 
-print("Rendering rounded (ICO) variants …")
-ico_imgs = {}
-for s in sorted(ico_sizes_set):
-    print(f"  {s:4d}px")
-    ico_imgs[s] = render(s, rounded=True)
 
-print("Rendering full-square (ICNS) variants …")
-icns_imgs = {}
-for s in sorted(icns_sizes_set):
-    print(f"  {s:4d}px")
-    icns_imgs[s] = render(s, rounded=False)
+# ── ICO writer (PNG-in-ICO, ARGB, Vista+) ────────────────────────────────
 
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` to ``path`` atomically, and only when the bytes differ.
+
+    An unchanged icon keeps its mtime, so re-running the generator does not
+    cascade into re-signing and re-bundling; the temp-file + replace means a
+    killed run can never leave a half-written icon behind.
+    """
+    if path.exists() and path.read_bytes() == data:
+        return False
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return True
 
-# ── ICO writer (PNG-in-ICO, ARGB, Vista+) ────────────────────────────────
 
 def write_ico(size_map: dict, path: Path) -> None:
     """Pack a {size: PIL.Image} dict into a PNG-in-ICO file."""
@@ -152,33 +161,65 @@ def write_ico(size_map: dict, path: Path) -> None:
         data   += pngs[s]
         offset += len(pngs[s])
 
-    path.write_bytes(header + directory + data)
+    if not write_if_changed(path, header + directory + data):
+        print(f"  (unchanged — skipped write of {path.name})")
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    # Chrome discovery and the temp workspace are deliberately inside main():
+    # merely importing this module (pytest collection, tooling scans) must not
+    # launch processes or touch the filesystem.
+    chrome = find_chrome()
+    work   = Path(tempfile.mkdtemp(prefix="neight_icon_"))
 
+    ico_sizes_set  = set(ICO_SIZES)
+    icns_sizes_set = set(ICNS_SPEC.values())
 
-print("\nPacking ICO …")
-ico_path = ROOT / "neight.ico"
-write_ico(ico_imgs, ico_path)
-print(f"  → {ico_path}  ({ico_path.stat().st_size:,} bytes)")
+    # The two variants are independent, and both their Chrome renders
+    # (a subprocess) and Pillow's C resize release the GIL, so run the
+    # pipelines concurrently.  Within one variant the pyramid levels feed
+    # each other, so each pipeline stays sequential internally.
+    def build(base: int, rounded: bool, sizes: set) -> dict:
+        return lanczos_pyramid(render(chrome, work, base, rounded), sizes)
 
+    print("Rendering rounded (ICO) and full-square (ICNS) variants in parallel …")
+    ico_base, icns_base = max(ico_sizes_set), max(icns_sizes_set)
+    print(f"  {ico_base}px / {icns_base}px via Chrome, smaller sizes via Lanczos pyramid")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        ico_future  = ex.submit(build, ico_base, True, ico_sizes_set)
+        icns_future = ex.submit(build, icns_base, False, icns_sizes_set)
+        ico_imgs, icns_imgs = ico_future.result(), icns_future.result()
 
-# ── ICNS via iconutil ─────────────────────────────────────────────────────
+    print("\nPacking ICO …")
+    ico_path = ROOT / "neight.ico"
+    write_ico(ico_imgs, ico_path)
+    print(f"  → {ico_path}  ({ico_path.stat().st_size:,} bytes)")
 
-print("\nPacking ICNS …")
-iconset = WORK / "neight.iconset"
-iconset.mkdir(exist_ok=True)
+    print("\nPacking ICNS …")
+    iconset = work / "neight.iconset"
+    iconset.mkdir(exist_ok=True)
+
+    for fname, size in ICNS_SPEC.items():
+        icns_imgs[size].save(iconset / fname, "PNG")
+
+    icns_path = ROOT / "neight.icns"
+    icns_tmp  = work / "neight.icns"
+    subprocess.run(
+        ["iconutil", "-c", "icns", str(iconset), "-o", str(icns_tmp)],
+        check=True,
+    )
+    if not write_if_changed(icns_path, icns_tmp.read_bytes()):
+        print(f"  (unchanged — skipped write of {icns_path.name})")
+    shutil.rmtree(iconset)
+    print(f"  → {icns_path}  ({icns_path.stat().st_size:,} bytes)")
 
-for fname, size in ICNS_SPEC.items():
-    icns_imgs[size].save(iconset / fname, "PNG")
+    shutil.rmtree(work, ignore_errors=True)
+    print("\nAll done ✓")
+    print(f"  {ico_path}")
+    print(f"  {icns_path}")
 
-icns_path = ROOT / "neight.icns"
-subprocess.run(
-    ["iconutil", "-c", "icns", str(iconset), "-o", str(icns_path)],
-    check=True,
-)
-shutil.rmtree(iconset)
-print(f"  → {icns_path}  ({icns_path.stat().st_size:,} bytes)")
 
-shutil.rmtree(WORK, ignore_errors=True)
-print("\nAll done ✓")
-print(f"  {ico_path}")
-print(f"  {icns_path}")
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,20 @@ Automatically increments the build number in neight.py before building.
 Format: YYYY.NNN where NNN is a 3-digit build number (e.g., 2025.002 -> 2025.003)
 """
 
+import argparse
 import re
 import sys
 from pathlib import Path
 from datetime import datetime
 
+# Compiled once at import so repeated invocations (build loops, orchestrators
+# importing this module) skip re.compile's cache lookup and pattern parse.
+_VERSION_RE = re.compile(r'(\d{4})\.(\d{3})')
+# Bytes pattern: neight.py is read and written as raw bytes so the whole file
+# never goes through a UTF-8 decode/encode round trip (and line endings are
+# preserved for free).  Only the short version string itself is decoded.
+_VERSION_LINE_RE = re.compile(rb'^VERSION = "(\d{4}\.\d{3})"', re.MULTILINE)
+
 
 def increment_version(version_str: str) -> str:
     """
@@ -16,7 +25,7 @@ def increment_version(version_str: str) -> str:
     Format: YYYY.NNN (e.g., 2025.002 -> 2025.003)
     If the year changes, reset to .001
     """
-    match = re.match(r'(\d{4})\.(\d{3})', version_str)
+    match = _VERSION_RE.match(version_str)
     if not match:
         print(f"Error: Invalid version format: {version_str}")
         print("Expected format: YYYY.NNN (e.g., 2025.002)")
@@ -40,47 +49,61 @@ def increment_version(version_str: str) -> str:
     return new_version
 
 
-def update_version_in_file(file_path: Path) -> tuple[str, str]:
+def update_version_in_file(file_path: Path, count: int = 1) -> tuple[str, str]:
     """
-    Update the VERSION variable in neight.py
+    Update the VERSION variable in neight.py, incrementing ``count`` times.
     Returns: (old_version, new_version)
     """
     if not file_path.exists():
         print(f"Error: File not found: {file_path}")
         sys.exit(1)
-    
-    # newline="" preserves the file's existing line endings on every platform.
-    with file_path.open("r", encoding="utf-8", newline="") as file:
-        content = file.read()
-    
+
+    content = file_path.read_bytes()
+
     # Find the VERSION line
-    version_pattern = r'^VERSION = "(\d{4}\.\d{3})"'
-    match = re.search(version_pattern, content, re.MULTILINE)
-    
+    match = _VERSION_LINE_RE.search(content)
+
     if not match:
         print("Error: Could not find VERSION variable in neight.py")
         print("Expected format: VERSION = \"YYYY.NNN\"")
         sys.exit(1)
-    
-    old_version = match.group(1)
-    new_version = increment_version(old_version)
-    
+
+    old_version = match.group(1).decode("ascii")
+    # All increments are applied in-process on the version string; the file is
+    # read once and written once no matter how many steps are requested.
+    new_version = old_version
+    for _ in range(count):
+        new_version = increment_version(new_version)
+
+    if new_version == old_version:
+        # Nothing to change — skip the write so neight.py's mtime is not
+        # churned (a rewrite retriggers every tool that watches the file).
+        return old_version, new_version
+
     # Replace the version
-    new_content = re.sub(
-        version_pattern,
-        f'VERSION = "{new_version}"',
+    new_content = _VERSION_LINE_RE.sub(
+        f'VERSION = "{new_version}"'.encode("ascii"),
         content,
         count=1,
-        flags=re.MULTILINE
     )
-    
-    with file_path.open("w", encoding="utf-8", newline="") as file:
-        file.write(new_content)
-    
+
+    file_path.write_bytes(new_content)
+
     return old_version, new_version
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Increment the VERSION in neight.py.")
+    parser.add_argument(
+        "--count", type=int, default=1, metavar="N",
+        help="number of build-number steps to apply in one run (default: 1); "
+             "lets a build matrix reserve N versions without paying N process "
+             "start-ups and N file rewrites",
+    )
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+
     script_dir = Path(__file__).parent
     neight_file = script_dir / "neight.py"
 
@@ -89,7 +112,7 @@ def main():
     print()
 
     try:
-        old_version, new_version = update_version_in_file(neight_file)
+        old_version, new_version = update_version_in_file(neight_file, args.count)
         print(f"Version updated: {old_version} -> {new_version}")
         return 0
     except Exception as e:
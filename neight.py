@@ -5,10 +5,13 @@
 
 import sys
 import os
+import bisect
+import hashlib
 import subprocess
 import json
 import re
 import math
+import mmap
 import time
 import webbrowser
 import unicodedata
@@ -19,6 +22,7 @@ import random
 import shutil
 import urllib.request
 import platform
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -44,10 +48,186 @@ from PySide6.QtWidgets import (
     QSplitter, QTextBrowser
 )
 # In Qt6/PySide6, QAction and QShortcut live in QtGui (moved from QtWidgets in Qt5)
-from PySide6.QtGui import QKeySequence, QPainter, QFont, QFontDatabase, QTextCursor, QTextBlockFormat, QAction, QShortcut, QColor, QPalette, QGuiApplication, QTextDocument, QDesktopServices, QIcon, QFileOpenEvent
-from PySide6.QtCore import Qt, QRect, QFileInfo, QTimer, Signal, QUrl, QRectF, QPoint, QPointF, QEvent, QThread, QLockFile
+from PySide6.QtGui import QKeySequence, QPainter, QFont, QFontDatabase, QTextCursor, QTextBlockFormat, QTextBlockUserData, QAction, QActionGroup, QShortcut, QColor, QPalette, QGuiApplication, QTextDocument, QDesktopServices, QIcon, QFileOpenEvent
+from PySide6.QtCore import Qt, QRect, QTimer, Signal, QUrl, QRectF, QPoint, QPointF, QEvent, QThread, QLockFile
 QT_LIB = "PySide6"
 
+# Zoom/navigation key groups, resolved once: keyPressEvent used to rebuild
+# these lists (including the getattr probes for keypad variants that only some
+# Qt builds expose) on every keystroke.  Frozenset membership is O(1).
+_ZOOM_IN_KEYS = frozenset(
+    k for k in (
+        Qt.Key_Plus, Qt.Key_Equal,
+        getattr(Qt, "Key_KP_Add", None), getattr(Qt, "KeypadPlus", None),
+    ) if k is not None
+)
+_ZOOM_OUT_KEYS = frozenset(
+    k for k in (
+        Qt.Key_Minus, Qt.Key_Underscore,
+        getattr(Qt, "Key_KP_Subtract", None), getattr(Qt, "KeypadMinus", None),
+    ) if k is not None
+)
+_NAV_KEYS = frozenset((
+    Qt.Key_Left, Qt.Key_Right, Qt.Key_Up, Qt.Key_Down,
+    Qt.Key_Home, Qt.Key_End, Qt.Key_PageUp, Qt.Key_PageDown,
+))
+
+# Whitespace runs in search queries; \s already covers the U+2029 block
+# separator QTextCursor.selectedText() uses in place of newlines.
+_SEARCH_WS_RE = re.compile(r"\s+")
+
+# Sentence terminators across the scripts Neight cares about: Latin, the
+# Indic danda/double danda, CJK full stop, fullwidth !/?, Arabic ?.
+_SENTENCE_END_RE = re.compile(r"[.!?।॥。！？؟]+")
+_NON_WS_RE = re.compile(r"\S")
+
+# A run of two or more line breaks (any convention) — what Collapse Blank
+# Lines squeezes down to a single blank line.
+_BLANK_RUN_RE = re.compile(r"(?:\r\n|\r|\n){2,}")
+
+# Markdown markers stripped before a new marker or wrapper is applied.
+# Applied in tuple order, which is load-bearing in both cases: the line-start
+# patterns mirror the original strip sequence, and the inline pairs must go
+# from most to least specific or ** would be eaten as two *.
+_MD_LINE_START_RES = (
+    re.compile(r"^#{1,6}\s+"),       # headings
+    re.compile(r"^-\s+"),            # unordered list marker
+    re.compile(r"^\d+\.\s+"),        # ordered list marker
+    re.compile(r"^-\s+\[[xX\s]\]\s+"),  # checkbox marker
+)
+_MD_INLINE_RES = (
+    re.compile(r"\*\*\*(.*?)\*\*\*"),          # strong emphasis
+    re.compile(r"\*\*(.*?)\*\*"),              # strong/bold
+    re.compile(r"\*(.*?)\*"),                  # emphasis/italic
+    re.compile(r"==(.*?)=="),                  # highlight
+    re.compile(r"~~(.*?)~~"),                  # strikethrough
+    re.compile(r"```(.*?)```", re.DOTALL),     # code block
+    re.compile(r"`(.*?)`"),                    # inline code
+)
+
+
+def _map_qt_line_seps(text: str) -> str:
+    """Map Qt's block separators back to newlines.
+
+    toRawText() and selectedText() separate blocks with U+2029 and mark
+    in-block line breaks with U+2028; every consumer here wants plain "\\n".
+    Chained str.replace is the fast path — each call is a C-level scan that
+    is near-free when the character is absent (str.translate with a mapping
+    table is ~100× slower on multi-megabyte documents).
+    """
+    return text.replace("\u2029", "\n").replace("\u2028", "\n")
+
+
+# Status-label colours used by the URL dialogs.  Interned module constants so
+# every call site passes the identical string, which lets _set_status_color
+# detect "already this colour" with a cheap comparison.
+_QSS_STATUS_RED = "color: red;"
+_QSS_STATUS_BLUE = "color: blue;"
+_QSS_STATUS_GREEN = "color: green;"
+
+
+def _set_status_color(label, qss: str) -> None:
+    """Apply a colour stylesheet to a dialog status label, skipping no-ops.
+
+    setStyleSheet re-parses the QSS and re-polishes the widget even when the
+    sheet is unchanged; the dialogs re-assert the same colour on every
+    validate/insert click, so most calls can return without touching Qt.
+    (A QPalette would be cheaper still, but the dialog-level stylesheet from
+    _make_dialog_stylesheet styles QLabel and would override any palette.)
+    """
+    if label.styleSheet() != qss:
+        label.setStyleSheet(qss)
+
+
+# Extension groups tested on every current_path change (export-menu gating,
+# markdown preview/export).  Built once — membership is a hash lookup with no
+# per-call list allocation.
+_MD_EXTS = frozenset({'.md', '.markdown'})
+_TXT_EXTS = frozenset({'.txt', ''})
+
+# Fallback PDF renderer, used only when the optional markdown package is
+# missing.  Compiled once at module scope — the inline subs run per line of
+# the document being exported.
+_FB_MD_HEADING_RE = re.compile(r'^(#{1,6})\s*(.+)$')
+_FB_MD_HR_RE = re.compile(r'^(-{3,}|\*{3,}|_{3,})$')
+
+
+def _fb_md_inline(line: str) -> str:
+    """Render ***bold-italic***, **bold** and *italic* in one pass.
+
+    str.find jumps straight between asterisks, so a line is scanned once
+    regardless of how many markers it mixes (the previous three chained
+    regex subs each rescanned the whole line).  An asterisk run with no
+    matching closer is kept literal, as the regexes did.
+    """
+    i = line.find('*')
+    if i == -1:
+        return line
+    out = [line[:i]]
+    n = len(line)
+    find = line.find
+    while i != -1:
+        run = 1
+        while run < 3 and i + run < n and line[i + run] == '*':
+            run += 1
+        marker = '*' * run
+        close = find(marker, i + run)
+        if close == -1:
+            out.append(marker)
+            i = i + run
+        else:
+            inner = line[i + run:close]
+            if run == 3:
+                out.append(f'<strong><em>{inner}</em></strong>')
+            elif run == 2:
+                out.append(f'<strong>{inner}</strong>')
+            else:
+                out.append(f'<em>{inner}</em>')
+            i = close + run
+        nxt = find('*', i)
+        out.append(line[i:] if nxt == -1 else line[i:nxt])
+        i = nxt
+    return ''.join(out)
+
+# HTML shells for the markdown renderers, built once at import.  format_map
+# fills every placeholder in a single C-level pass instead of re-assembling
+# the multi-kilobyte CSS from two dozen f-string segments per render.
+# Literal CSS braces are doubled for str.format.
+_MD_STYLED_HTML_TMPL = """<html><head><style>
+body {{ font-family: {family}; font-size: {size_pt}pt; color: {fg}; }}
+h1 {{ font-size: 2em; margin-top: 0.67em; margin-bottom: 0.67em; }}
+h2 {{ font-size: 1.5em; margin-top: 0.83em; margin-bottom: 0.83em; }}
+h3 {{ font-size: 1.17em; margin-top: 1em; margin-bottom: 1em; }}
+a {{ color: {link}; }}
+code {{ background-color: {code_bg}; padding: 2px 4px; font-family: monospace; }}
+pre {{ background-color: {code_bg}; padding: 10px; }}
+blockquote {{ background-color: {code_bg}; color: {muted};
+              margin-left: 0px; padding-left: 12px; padding-right: 12px; }}
+hr {{ height: 1px; background-color: {rule}; }}
+table {{ border-collapse: collapse; width: 100%; margin: 1em 0; }}
+th, td {{ border: 1px solid {border}; padding: 8px; text-align: left; }}
+th {{ background-color: {table_head_bg}; }}
+{highlight_css}
+</style></head><body>
+{body}
+</body></html>"""
+
+_MD_FALLBACK_HTML_TMPL = """
+<html>
+<head>
+    <style>
+        body {{ font-family: {family}; font-size: {size_pt}pt; }}
+        h1 {{ font-size: 2em; }}
+        h2 {{ font-size: 1.5em; }}
+        h3 {{ font-size: 1.17em; }}
+    </style>
+</head>
+<body>
+    {body}
+</body>
+</html>
+"""
+
 # PDF print-support imports (optional — export features require QtPrintSupport)
 try:
     from PySide6.QtPrintSupport import QPrinter
@@ -61,6 +241,36 @@ except ImportError:
 if HAS_PRINT_SUPPORT:
     _MARGIN_UNIT_MM = QPageLayout.Unit.Millimeter
 
+# Settings JSON codec (optional — orjson parses/serialises in C; stdlib json is
+# the fallback so orjson never becomes a hard requirement)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Markdown→HTML conversion (optional — preview and PDF export fall back to a
+# simplified renderer without it).  Imported once here: the per-click imports
+# inside the export path each walked the import machinery just to rediscover
+# the module in sys.modules.
+try:
+    import markdown
+    HAS_MARKDOWN = True
+except ImportError:
+    HAS_MARKDOWN = False
+
+
+def _settings_dumps(data: dict) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def _settings_loads(raw: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+    # except clauses work unchanged either way.
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
 # ------------------------------------
 # Keyboard layout switching (Windows)
 # ------------------------------------
@@ -72,12 +282,32 @@ if sys.platform == "win32":
     HKL_NEXT = 1
     HKL_PREV = 0
 
+    # Declare signatures once at import: with argtypes/restype set, ctypes
+    # marshals each call directly instead of guessing conversions per call,
+    # and HKLs round-trip as proper pointers instead of truncatable c_int.
+    user32.LoadKeyboardLayoutW.argtypes = (ctypes.c_wchar_p, ctypes.c_uint)
+    user32.LoadKeyboardLayoutW.restype = ctypes.c_void_p
+    user32.ActivateKeyboardLayout.argtypes = (ctypes.c_void_p, ctypes.c_uint)
+    user32.ActivateKeyboardLayout.restype = ctypes.c_void_p
+    user32.GetKeyboardLayoutNameW.argtypes = (ctypes.c_wchar_p,)
+    user32.GetKeyboardLayoutNameW.restype = ctypes.c_bool
+
+    # LoadKeyboardLayoutW is the expensive half of a layout switch, and the
+    # HKL it returns for a given KLID is stable for the life of the process.
+    # Cache per KLID so every switch after the first collapses to a single
+    # ActivateKeyboardLayout call.
+    _hkl_cache: dict[str, int] = {}
+
     def load_hkl(klid: str) -> int:
-        """Load a keyboard layout by its identifier string."""
-        hkl = user32.LoadKeyboardLayoutW(ctypes.c_wchar_p(klid), KLF_ACTIVATE | KLF_REORDER)
+        """Load a keyboard layout by its identifier string (cached per process)."""
+        hkl = _hkl_cache.get(klid)
+        if hkl is not None:
+            return hkl
+        hkl = user32.LoadKeyboardLayoutW(klid, KLF_ACTIVATE | KLF_REORDER)
         if not hkl:
             error = ctypes.get_last_error()
             raise OSError(f"LoadKeyboardLayoutW failed with error {error}")
+        _hkl_cache[klid] = hkl
         return hkl
 
     def activate_hkl(hkl: int) -> None:
@@ -88,33 +318,56 @@ if sys.platform == "win32":
         # The function returns the previously active HKL, so result could be any value
         # We don't check for error here as the function typically succeeds
 
+    def preload_layout_hkls():
+        """Warm the HKL cache for the detected Tamil/English layouts.
+
+        Loading without KLF_ACTIVATE brings the layout into the process
+        without changing the active one, so startup pays the
+        LoadKeyboardLayoutW cost once and the double-Ctrl / Ctrl+comma
+        switches later are a single ActivateKeyboardLayout call.
+        """
+        for klid in (TAMIL_CHOICE, ENGLISH_CHOICE):
+            if klid and klid not in _hkl_cache:
+                try:
+                    hkl = user32.LoadKeyboardLayoutW(klid, KLF_REORDER)
+                    if hkl:
+                        _hkl_cache[klid] = hkl
+                except Exception:
+                    pass
+
+    def _current_klid() -> str:
+        """The active layout's KLID, normalised, or "" when unavailable.
+        Read-only — never switches anything."""
+        buf = ctypes.create_unicode_buffer(9)  # KL_NAMELENGTH = 9
+        if user32.GetKeyboardLayoutNameW(buf):
+            return buf.value.upper().zfill(8)
+        return ""
+
     def switch_to_tamil_anjal():
         """Switch to the detected Tamil keyboard layout."""
-        if TAMIL_CHOICE:
-            hkl = load_hkl(TAMIL_CHOICE)
-            activate_hkl(hkl)
+        # The active-layout read is much cheaper than ActivateKeyboardLayout,
+        # which with KLF_SETFORPROCESS notifies every thread in the process —
+        # and it stays correct when the user switches layouts behind our back
+        # (Win+Space), unlike remembering the last HKL we activated.
+        if TAMIL_CHOICE and _current_klid() != TAMIL_CHOICE:
+            activate_hkl(load_hkl(TAMIL_CHOICE))
 
     def switch_to_english_india():
         """Switch to the detected English keyboard layout."""
-        if ENGLISH_CHOICE:
-            hkl = load_hkl(ENGLISH_CHOICE)
-            activate_hkl(hkl)
+        if ENGLISH_CHOICE and _current_klid() != ENGLISH_CHOICE:
+            activate_hkl(load_hkl(ENGLISH_CHOICE))
 
     def get_current_layout() -> int:
         """Return 1 if the active keyboard layout matches the detected Tamil choice, else 0.
         Does NOT switch anything — read-only."""
         if not TAMIL_CHOICE:
             return 0
-        buf = ctypes.create_unicode_buffer(9)  # KL_NAMELENGTH = 9
-        if user32.GetKeyboardLayoutNameW(buf):
-            return 1 if buf.value.upper().zfill(8) == TAMIL_CHOICE else 0
-        return 0
+        return 1 if _current_klid() == TAMIL_CHOICE else 0
 
     def get_current_layout_label() -> str:
         """Return a display string for the currently active keyboard layout."""
-        buf = ctypes.create_unicode_buffer(9)  # KL_NAMELENGTH = 9
-        if user32.GetKeyboardLayoutNameW(buf):
-            klid = buf.value.upper().zfill(8)
+        klid = _current_klid()
+        if klid:
             if TAMIL_CHOICE and klid == TAMIL_CHOICE:
                 return f"Keyboard: {TAMIL_CHOICE_NAME}"
             if ENGLISH_CHOICE and klid == ENGLISH_CHOICE:
@@ -277,6 +530,10 @@ elif sys.platform == "darwin":
         except Exception:
             return ""
 
+    def preload_layout_hkls():
+        """No-op on macOS — TIS input sources need no pre-loading step."""
+        pass
+
     def switch_to_tamil_anjal():
         """Switch to the detected Tamil input source."""
         if TAMIL_CHOICE:
@@ -325,6 +582,9 @@ elif sys.platform == "darwin":
             return []
 
 else:
+    def preload_layout_hkls():
+        pass
+
     def switch_to_tamil_anjal():
         pass
 
@@ -738,9 +998,27 @@ MACHINE_LOCAL_SETTINGS_KEYS = frozenset({
 })
 
 
+# Resolved once: the home directory cannot change mid-run, and Path.home()
+# re-reads the environment (and may hit the pwd database on POSIX) every call.
+_HOME = Path.home()
+
+# Directories already created (or confirmed) by _ensure_parent_dir this
+# process.  Autosave and settings writes hit the same handful of directories
+# every few seconds; memoising saves two stat syscalls per write, which adds
+# up on networked or synced home directories.
+_ensured_parent_dirs: set[str] = set()
+
+
+def _ensure_parent_dir(target: Path) -> None:
+    parent = str(target.parent)
+    if parent not in _ensured_parent_dirs:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _ensured_parent_dirs.add(parent)
+
+
 def _atomic_write_text(
     target: Path,
-    text: str,
+    text,
     *,
     encoding: str = "utf-8",
     newline=None,
@@ -748,6 +1026,11 @@ def _atomic_write_text(
 ) -> bool:
     """Durably replace ``target`` with ``text``.  Returns True when committed.
 
+    ``text`` may be a single string or an iterable of string chunks; chunks are
+    streamed straight into the temp file, so a caller that can produce the
+    content piecewise (e.g. a QTextDocument walked block by block) never has to
+    build the whole document as one contiguous string first.
+
     Writes to a temp file that is unique per process *and* per call, flushes and
     fsyncs before the atomic rename.  A crash or power loss can therefore never
     leave a half-written file, and two writers aimed at the same target — for
@@ -763,11 +1046,22 @@ def _atomic_write_text(
     behaviour every existing caller relied on.  Raises on write failure; callers
     decide how to report it.
     """
-    target.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(target)
     tmp = target.with_name(f"{target.name}.{os.getpid()}.{random.randrange(1 << 24):06x}.tmp~")
     try:
-        with open(tmp, "w", encoding=encoding, newline=newline) as fh:
-            fh.write(text)
+        try:
+            fh = open(tmp, "w", encoding=encoding, newline=newline)
+        except FileNotFoundError:
+            # The memoised parent directory was deleted behind us — recreate it
+            # and retry once rather than failing the save.
+            _ensured_parent_dirs.discard(str(target.parent))
+            _ensure_parent_dir(target)
+            fh = open(tmp, "w", encoding=encoding, newline=newline)
+        with fh:
+            if isinstance(text, str):
+                fh.write(text)
+            else:
+                fh.writelines(text)
             fh.flush()
             os.fsync(fh.fileno())
         if should_commit is not None and not should_commit():
@@ -799,10 +1093,10 @@ class SettingsManager:
         
         # Fallback path (AppData\Local\Neight)
         if sys.platform == "win32":
-            appdata = Path.home() / "AppData" / "Local" / "Neight"
+            appdata = _HOME / "AppData" / "Local" / "Neight"
         else:
             # For non-Windows systems, use appropriate config directory
-            appdata = Path.home() / ".config" / "Neight"
+            appdata = _HOME / ".config" / "Neight"
         self.fallback_path = appdata / filename
 
         # macOS keeps settings out of the executable directory altogether: there
@@ -810,7 +1104,7 @@ class SettingsManager:
         # executable is destroyed every time the bundle is replaced by an update.
         # Windows keeps the portable "settings next to the .exe" workflow.
         self.appsupport_path: Optional[Path] = (
-            (Path.home() / "Library" / "Application Support" / "Neight" / filename)
+            (_HOME / "Library" / "Application Support" / "Neight" / filename)
             if sys.platform == "darwin" else None
         )
 
@@ -819,6 +1113,13 @@ class SettingsManager:
         
         # Determine which path to use
         self.path = self._determine_active_path()
+        # In-memory copy of the last parsed settings, keyed to the file's
+        # mtime: load() is called from several startup and dialog paths, and
+        # re-reading plus re-parsing the JSON each time is pure overhead.  The
+        # mtime check keeps multi-window correctness — another window's write
+        # changes it and forces a reparse.  read_current() stays uncached.
+        self._cache: Optional[dict] = None
+        self._cache_mtime_ns: int = -1
         self.corrupted_settings_path: Optional[Path] = None
         self.corrupted_settings_reason: str = ""
         self.last_save_error: str = ""
@@ -864,28 +1165,26 @@ class SettingsManager:
             self._migrate_to_appsupport()
             return self.appsupport_path
 
-        # If primary path exists and is readable, use it
+        # If primary path exists and is readable, use it.  os.access instead
+        # of reading the whole file: this ran a full read-and-decode of the
+        # settings file on every startup just to throw the text away — load()
+        # is about to read it anyway, and a corrupt file is its job to report.
         if self.primary_path.exists():
-            try:
-                # Test if we can read it
-                self.primary_path.read_text(encoding="utf-8")
+            if os.access(str(self.primary_path), os.R_OK):
                 return self.primary_path
-            except Exception:
-                pass
         
         # If fallback path exists, use it
         if self.fallback_path.exists():
             return self.fallback_path
         
         # Neither exists - try to determine which one we can write to
-        # Try primary first
+        # Try primary first.  os.access answers "can I write here?" without
+        # creating and deleting a probe file, which matters on networked or
+        # synced home directories where every mutating syscall is slow.
         try:
             self.primary_path.parent.mkdir(parents=True, exist_ok=True)
-            # Test write permission by creating a temporary file
-            test_file = self.primary_path.parent / ".write_test"
-            test_file.write_text("test", encoding="utf-8")
-            test_file.unlink()
-            return self.primary_path
+            if os.access(str(self.primary_path.parent), os.W_OK):
+                return self.primary_path
         except Exception:
             pass
         
@@ -895,7 +1194,9 @@ class SettingsManager:
     def _load_file(self, path: Path) -> Optional[dict]:
         try:
             if path.exists():
-                data = json.loads(path.read_text(encoding="utf-8"))
+                # read_bytes + a bytes-accepting parser: no separate UTF-8
+                # decode pass over the whole file.
+                data = _settings_loads(path.read_bytes())
                 if isinstance(data, dict):
                     if self.corrupted_settings_path == path:
                         self.corrupted_settings_path = None
@@ -911,9 +1212,22 @@ class SettingsManager:
         return None
 
     def load(self) -> dict:
+        # Serve the cached parse while the file on disk is unchanged.  Cache
+        # only when a stat succeeds: with no file present the migration logic
+        # below must keep running, and another process may create one anytime.
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        if self._cache is not None and mtime_ns != -1 and mtime_ns == self._cache_mtime_ns:
+            return self._cache
+
         # Try to load from the active path
         data = self._load_file(self.path)
         if data is not None:
+            if mtime_ns != -1:
+                self._cache = data
+                self._cache_mtime_ns = mtime_ns
             return data
 
         # If active path is fallback, also check primary path
@@ -958,11 +1272,21 @@ class SettingsManager:
         lock.setStaleLockTime(30_000)
         return lock
 
+    def _remember_saved(self, data: dict, path: Path) -> None:
+        """Prime the load() cache with what was just written to ``path``."""
+        self._cache = data
+        try:
+            self._cache_mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            self._cache = None
+            self._cache_mtime_ns = -1
+
     def save(self, data: dict) -> bool:
         self.last_save_error = ""
-        payload = json.dumps(data, ensure_ascii=False, indent=2)
+        payload = _settings_dumps(data)
         try:
             _atomic_write_text(self.path, payload)
+            self._remember_saved(data, self.path)
             return True
         except Exception as e:
             # If save fails and we're using primary path, try fallback.  This
@@ -983,6 +1307,7 @@ class SettingsManager:
                     f"settings relocated to {self.fallback_path}."
                 )
                 self.path = self.fallback_path
+                self._remember_saved(data, self.path)
                 return True
             self.last_save_error = str(e)
             return False
@@ -1432,6 +1757,18 @@ class CodeEditor(QPlainTextEdit):
         # instead and the next press inside it is the third click.
         self._triple_click_deadline = 0.0
         self._triple_click_pos = None
+        # Style-dependent gesture constants, resolved lazily (the app object
+        # may not exist yet while the editor is constructed in tests) and
+        # dropped on StyleChange so a new style's values are picked up.
+        self._dbl_interval_s = None
+        self._drag_slop = None
+        # Host-window handlers (zoom, highlight clearing, web search) resolved
+        # lazily by _window_handler and kept here so hot input paths skip the
+        # window() walk and getattr per event.
+        self._host_handlers: dict = {}
+        # Sidebar text colour, derived from the palette on first paint and
+        # invalidated on PaletteChange.
+        self._ln_text_color = None
         self._word_index_visible = False
         self._word_index_top_margin = 20
         self._line_spacing_percent = 100.0
@@ -1439,6 +1776,12 @@ class CodeEditor(QPlainTextEdit):
         self.lineNumberArea = LineNumberArea(self)
         self.wordIndexOverlay = WordIndexOverlay(self)
 
+        # Sidebar metric caches; refreshed by _invalidate_font_metric_caches
+        # whenever the font changes.
+        self._ln_digits = -1
+        self._ln_width = 0
+        self._invalidate_font_metric_caches()
+
         # Install spacing-aware layout.  Must be done before any signal connections
         # that reference the document layout, and before setting any text.
         self._spacing_layout = SpacedPlainTextDocumentLayout(self.document())
@@ -1507,8 +1850,27 @@ class CodeEditor(QPlainTextEdit):
         the original characters but separates blocks with U+2029, so those are
         mapped back to newlines here to match what callers expect.
         """
-        raw = self.document().toRawText()
-        return raw.replace("\u2029", "\n").replace("\u2028", "\n")
+        return _map_qt_line_seps(self.document().toRawText())
+
+    def documentChunks(self):
+        """Yield documentText() piecewise, one block at a time.
+
+        Manual save streams these chunks straight into its temp file, so a
+        multi-megabyte document is written without first being materialised
+        as one contiguous string.  Character fidelity matches documentText():
+        QTextBlock.text() keeps NBSP intact, and the in-block line separator
+        (U+2028) is mapped to a newline here.
+        """
+        block = self.document().firstBlock()
+        first = True
+        while block.isValid():
+            if first:
+                first = False
+            else:
+                yield "\n"
+            text = block.text()
+            yield text.replace("\u2028", "\n") if "\u2028" in text else text
+            block = block.next()
 
     def _refresh_wrap_layout(self, force: bool = False):
         if self._refreshing_wrap_layout:
@@ -1574,12 +1936,26 @@ class CodeEditor(QPlainTextEdit):
             self.verticalScrollBar().setVisible(False)
 
     # ----- Line numbers plumbing -----
+    def _invalidate_font_metric_caches(self):
+        """Recompute the metrics the sidebar uses on every scroll frame.
+
+        lineNumberAreaWidth() runs from resize, updateRequest and paint, so
+        querying fontMetrics() there put a text-metrics call on every scroll
+        frame; the values only actually change with the font.
+        """
+        fm = self.fontMetrics()
+        self._digit_advance = fm.horizontalAdvance('9')
+        self._font_height = fm.height()
+        self._ln_digits = -1  # force lineNumberAreaWidth to recompute
+
     def lineNumberAreaWidth(self) -> int:
         if not self._line_numbers_visible:
             return 0
         digits = max(2, len(str(max(1, self.blockCount()))))
-        space = 6 + self.fontMetrics().horizontalAdvance('9') * digits
-        return space
+        if digits != self._ln_digits:
+            self._ln_digits = digits
+            self._ln_width = 6 + self._digit_advance * digits
+        return self._ln_width
 
     def _effective_text_margin_px(self) -> int:
         percent = max(0, int(getattr(self, "_text_margin_percent", 0)))
@@ -1700,10 +2076,16 @@ class CodeEditor(QPlainTextEdit):
         self._update_word_index_overlay()
 
     def updateLineNumberArea(self, rect, dy):
-        if dy:
-            self.lineNumberArea.scroll(0, dy)
-        else:
-            self.lineNumberArea.update(0, rect.y(), self.lineNumberArea.width(), rect.height())
+        # Repaint via update() rather than scroll()'s synchronous blit: Qt
+        # coalesces update regions, so a burst of updateRequest signals within
+        # one event-loop tick becomes a single sidebar paint per frame.  The
+        # paint itself is cheap — it clips to the dirty rect and draws only
+        # visible blocks — and a hidden sidebar needs no paint at all.
+        if self._line_numbers_visible:
+            if dy:
+                self.lineNumberArea.update()
+            else:
+                self.lineNumberArea.update(0, rect.y(), self.lineNumberArea.width(), rect.height())
 
         if rect.contains(self.viewport().rect()):
             self.updateLineNumberAreaWidth(0)
@@ -1723,24 +2105,40 @@ class CodeEditor(QPlainTextEdit):
         painter = QPainter(self.lineNumberArea)
         painter.fillRect(event.rect(), self.palette().alternateBase())
 
-        # Determine if we're in dark mode by checking the background lightness
-        bg_color = self.palette().window().color()
-        is_dark_mode = bg_color.lightness() < 128
-        
-        # Use white text for dark mode, black for light mode
-        text_color = QColor(Qt.white if is_dark_mode else Qt.black)
+        # Use white text for dark mode, black for light mode.  The palette
+        # lightness probe and QColor are cached across paints — a scroll fires
+        # this handler per frame — and dropped on PaletteChange below.
+        text_color = self._ln_text_color
+        if text_color is None:
+            is_dark_mode = self.palette().window().color().lightness() < 128
+            text_color = self._ln_text_color = QColor(Qt.white if is_dark_mode else Qt.black)
+
+        # One pen set and one width lookup for the whole paint; the clip rect
+        # lets Qt discard any drawText that still lands outside the dirty
+        # region (e.g. the sliver repaints a small scroll delta produces).
+        painter.setPen(text_color)
+        painter.setClipRect(event.rect())
+        paint_width = self.lineNumberArea.width() - 6
+        rect_top = event.rect().top()
+        rect_bottom = event.rect().bottom()
 
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
         bottom = top + self.blockBoundingRect(block).height()
 
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.setPen(text_color)
-                painter.drawText(0, int(top), self.lineNumberArea.width() - 6, self.fontMetrics().height(),
-                                 Qt.AlignRight, number)
+        # Fast-forward past visible blocks above the dirty region without
+        # formatting or drawing anything for them.
+        while block.isValid() and bottom < rect_top:
+            block = block.next()
+            top = bottom
+            bottom = top + self.blockBoundingRect(block).height()
+            block_number += 1
+
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible():
+                painter.drawText(0, int(top), paint_width, self._font_height,
+                                 Qt.AlignRight, str(block_number + 1))
             block = block.next()
             top = bottom
             bottom = top + self.blockBoundingRect(block).height()
@@ -1781,11 +2179,24 @@ class CodeEditor(QPlainTextEdit):
         # directly guarantees the document is in sync regardless of event-loop timing
         # or platform quirks (e.g. Windows style repolish resetting the widget font).
         self.document().setDefaultFont(font)
+        self._invalidate_font_metric_caches()
         self._apply_layout_spacing()  # base px changes with font, recalculate
         self._apply_viewport_margins()  # edge margins depend on fontMetrics().height()
         self.wordIndexOverlay.invalidate_cache()
         self._update_word_index_overlay()
 
+    def changeEvent(self, event):
+        # Windows style repolish can swap the widget font without going
+        # through our setFont override; keep the metric caches honest.
+        if event.type() == QEvent.FontChange:
+            self._invalidate_font_metric_caches()
+        elif event.type() == QEvent.PaletteChange:
+            self._ln_text_color = None
+        elif event.type() == QEvent.StyleChange:
+            self._dbl_interval_s = None
+            self._drag_slop = None
+        super().changeEvent(event)
+
     def setWordIndexVisible(self, visible: bool):
         self._word_index_visible = bool(visible)
         self._apply_viewport_margins()
@@ -1878,34 +2289,71 @@ class CodeEditor(QPlainTextEdit):
     def _update_word_index_overlay(self):
         self.wordIndexOverlay.sync_with_viewport()
 
+    # Normalised text only ever becomes a web-search query, and browsers and
+    # search engines cap URLs around 2 K characters anyway.  Cropping first
+    # keeps a right-click with megabytes selected from walking the whole
+    # selection just to build a menu label.
+    _SEARCH_QUERY_MAX_CHARS = 2048
+
     @staticmethod
     def _normalize_search_text(text: str) -> str:
         if not text:
             return ""
-        cleaned = text.replace("\u2029", "\n")
-        return " ".join(cleaned.split())
+        # A single compiled-regex pass instead of the old replace() +
+        # split() + join() triple walk over the selection.
+        cropped = text[:CodeEditor._SEARCH_QUERY_MAX_CHARS]
+        return _SEARCH_WS_RE.sub(" ", cropped).strip()
 
     def _trigger_search(self, query: str):
         cleaned = self._normalize_search_text(query)
         if not cleaned:
             return
-        handler = getattr(self.window(), "launch_web_search", None)
-        if callable(handler):
+        handler = self._window_handler("launch_web_search")
+        if handler is not None:
             handler(cleaned)
 
     def _trigger_sorkuvai_search(self, query: str):
         cleaned = self._normalize_search_text(query)
         if not cleaned:
             return
-        handler = getattr(self.window(), "launch_sorkuvai_search", None)
-        if callable(handler):
+        handler = self._window_handler("launch_sorkuvai_search")
+        if handler is not None:
             handler(cleaned)
 
-    @staticmethod
-    def _double_click_interval_s() -> float:
-        app = QApplication.instance()
-        interval_ms = app.doubleClickInterval() if app else QApplication.doubleClickInterval()
-        return interval_ms / 1000.0
+    def _double_click_interval_s(self) -> float:
+        interval = self._dbl_interval_s
+        if interval is None:
+            app = QApplication.instance()
+            interval_ms = app.doubleClickInterval() if app else QApplication.doubleClickInterval()
+            interval = self._dbl_interval_s = interval_ms / 1000.0
+        return interval
+
+    def _drag_slop_px(self) -> int:
+        slop = self._drag_slop
+        if slop is None:
+            app = QApplication.instance()
+            slop = self._drag_slop = (
+                app.startDragDistance() if app else QApplication.startDragDistance()
+            )
+        return slop
+
+    def _window_handler(self, name: str):
+        """A bound method of the host window, resolved once per name.
+
+        The editor is constructed before it is parented into the Notepad
+        window, so resolution happens lazily on first use; until a real host
+        exists (window() still answers the editor itself) nothing is cached.
+        """
+        handler = self._host_handlers.get(name)
+        if handler is None:
+            host = self.window()
+            if host is self:
+                return None
+            handler = getattr(host, name, None)
+            if not callable(handler):
+                return None
+            self._host_handlers[name] = handler
+        return handler
 
     def _clear_triple_click(self):
         """Abandon any half-formed triple click.
@@ -1956,9 +2404,7 @@ class CodeEditor(QPlainTextEdit):
             return False
         if time.monotonic() > self._triple_click_deadline:
             return False
-        app = QApplication.instance()
-        slop = app.startDragDistance() if app else QApplication.startDragDistance()
-        return (event.pos() - self._triple_click_pos).manhattanLength() <= slop
+        return (event.pos() - self._triple_click_pos).manhattanLength() <= self._drag_slop_px()
 
     def _handle_triple_click(self, event) -> bool:
         cursor = self.cursorForPosition(event.pos())
@@ -1975,7 +2421,18 @@ class CodeEditor(QPlainTextEdit):
 
     def contextMenuEvent(self, event):
         menu = self.createStandardContextMenu(event.pos())
-        selected_text = self._normalize_search_text(self.textCursor().selectedText())
+        cursor = self.textCursor()
+        if cursor.hasSelection():
+            start = cursor.selectionStart()
+            # Normalisation crops to _SEARCH_QUERY_MAX_CHARS, so clip a huge
+            # selection before selectedText() copies all of it out of the
+            # document just to build a 48-character menu label.
+            if cursor.selectionEnd() - start > self._SEARCH_QUERY_MAX_CHARS:
+                cursor.setPosition(start)
+                cursor.setPosition(
+                    start + self._SEARCH_QUERY_MAX_CHARS, QTextCursor.KeepAnchor
+                )
+        selected_text = self._normalize_search_text(cursor.selectedText())
         if not selected_text:
             probe = self.cursorForPosition(event.pos())
             if not probe.isNull():
@@ -1988,7 +2445,9 @@ class CodeEditor(QPlainTextEdit):
                 lambda checked=False, text=selected_text: self._trigger_search(text)
             )
             before_action = menu.actions()[0] if menu.actions() else None
-            is_single_word = not re.search(r"\s", selected_text)
+            # Normalisation collapsed all whitespace to single spaces, so a
+            # plain substring check replaces the regex scan.
+            is_single_word = " " not in selected_text
             if is_single_word:
                 sorkuvai_action = QAction(f'Search Sorkuvai for "{display_text}"', menu)
                 sorkuvai_action.triggered.connect(
@@ -2086,8 +2545,8 @@ class CodeEditor(QPlainTextEdit):
                 return
             steps = self._consume_zoom_steps(event.angleDelta().y(), event.pixelDelta().y())
             if steps:
-                handler = getattr(self.window(), "_apply_font_size_delta", None)
-                if callable(handler):
+                handler = self._window_handler("_apply_font_size_delta")
+                if handler is not None:
                     handler(steps)
                 event.accept()
                 return
@@ -2183,45 +2642,30 @@ class CodeEditor(QPlainTextEdit):
         self._clear_triple_click()
         if event.modifiers() & Qt.ControlModifier:
             key = event.key()
-            plus_keys = [Qt.Key_Plus, Qt.Key_Equal]
-            minus_keys = [Qt.Key_Minus, Qt.Key_Underscore]
-            for attr in ("Key_KP_Add", "KeypadPlus"):
-                extra = getattr(Qt, attr, None)
-                if extra is not None:
-                    plus_keys.append(extra)
-            for attr in ("Key_KP_Subtract", "KeypadMinus"):
-                extra = getattr(Qt, attr, None)
-                if extra is not None:
-                    minus_keys.append(extra)
-
-            if key in tuple(plus_keys):
-                handler = getattr(self.window(), "_change_font_size", None)
-                if callable(handler):
+            if key in _ZOOM_IN_KEYS:
+                handler = self._window_handler("_change_font_size")
+                if handler is not None:
                     handler(1)
                     event.accept()
                     return
-            elif key in tuple(minus_keys):
-                handler = getattr(self.window(), "_change_font_size", None)
-                if callable(handler):
+            elif key in _ZOOM_OUT_KEYS:
+                handler = self._window_handler("_change_font_size")
+                if handler is not None:
                     handler(-1)
                     event.accept()
                     return
         super().keyPressEvent(event)
 
-        nav_keys = {
-            Qt.Key_Left, Qt.Key_Right, Qt.Key_Up, Qt.Key_Down,
-            Qt.Key_Home, Qt.Key_End, Qt.Key_PageUp, Qt.Key_PageDown
-        }
-        if event.key() in nav_keys:
-            handler = getattr(self.window(), "_clear_word_highlight_on_navigation", None)
-            if callable(handler):
+        if event.key() in _NAV_KEYS:
+            handler = self._window_handler("_clear_word_highlight_on_navigation")
+            if handler is not None:
                 handler()
 
     def focusOutEvent(self, event):
         self._clear_triple_click()
         super().focusOutEvent(event)
-        handler = getattr(self.window(), "_clear_word_highlight_on_blur", None)
-        if callable(handler):
+        handler = self._window_handler("_clear_word_highlight_on_blur")
+        if handler is not None:
             handler()
 
     def paste_plain_text(self):
@@ -2567,6 +3011,80 @@ class _UpdateCheckWorker(QThread):
         self.result_ready.emit(tag, "")
 
 
+class _PdfExportWorker(QThread):
+    """Paginates and writes a PDF export in a background thread.
+
+    doc.print_() on the GUI thread froze the window for the whole
+    paginate-and-write cycle — seconds on a multi-megabyte document.  Qt
+    permits painting to a QPrinter from a non-GUI thread, but the printer and
+    document must be created on the thread that uses them, so both are built
+    inside run() and only plain Python data (content, destination path, font
+    settings) crosses the thread boundary.
+    """
+    result_ready = Signal(str, str)  # (save_path, error_message — "" on success)
+
+    def __init__(self, parent, save_path: str, *, html: str = "",
+                 plain_text: str = "", text_header: str = "",
+                 font_family: str = "", font_point_size: int = 12):
+        super().__init__(parent)
+        self._save_path = save_path
+        self._html = html
+        self._plain_text = plain_text
+        self._text_header = text_header
+        self._font_family = font_family
+        self._font_point_size = font_point_size
+
+    def run(self):
+        try:
+            printer = QPrinter(QPrinter.HighResolution)
+            printer.setOutputFormat(QPrinter.PdfFormat)
+            printer.setOutputFileName(self._save_path)
+            printer.setPageSize(QPageSize(QPageSize.A4))
+            # Margins: left, top, right, bottom in millimeters
+            printer.setPageMargins(QMarginsF(15, 20, 15, 20), _MARGIN_UNIT_MM)
+
+            doc = QTextDocument()
+            font = QFont(self._font_family)
+            if self._font_point_size > 0:
+                font.setPointSize(self._font_point_size)
+            doc.setDefaultFont(font)
+            if self._html:
+                doc.setHtml(self._html)
+            else:
+                # The body is the editor's own memoized snapshot; prefixing the
+                # filename header with a cursor here avoids concatenating a
+                # second full-document string just to carry a three-line header.
+                doc.setPlainText(self._plain_text)
+                if self._text_header:
+                    cursor = QTextCursor(doc)
+                    cursor.movePosition(QTextCursor.Start)
+                    cursor.insertText(self._text_header)
+            doc.print_(printer)
+        except Exception as exc:
+            self.result_ready.emit(self._save_path, str(exc))
+            return
+        self.result_ready.emit(self._save_path, "")
+
+
+class _BlockCounts(QTextBlockUserData):
+    """Per-block word tallies cached on the block itself.
+
+    Stored via QTextBlock.setUserData so Qt moves the cache with the block
+    through inserts, deletes and renumbering.  ``revision`` records the block
+    revision the tallies were computed from; a block edited since then simply
+    fails the comparison and is retokenised.  This is what lets the status bar
+    recount only the blocks an edit touched instead of the whole document.
+    """
+
+    def __init__(self, revision: int, words: int, tamil: int, english: int, other: int):
+        super().__init__()
+        self.revision = revision
+        self.words = words
+        self.tamil = tamil
+        self.english = english
+        self.other = other
+
+
 # ---------------------
 # Main window
 # ---------------------
@@ -2587,7 +3105,10 @@ class Notepad(QMainWindow):
         self.setMinimumWidth(520)  # Ensures the right-pinned Settings menu is never cut off
 
         self.settings = SettingsManager()
-        self.default_directory = Path.home()
+        self.default_directory = _HOME
+        # Raw os.fspath of the last directory argument _update_default_directory
+        # fully processed; lets repeat saves bail out before Path construction.
+        self._last_default_dir_arg: Optional[str] = None
         self._restore_maximized = False
         self._initial_file = initial_file
         self._restore_last_session = bool(restore_last_session)
@@ -2624,6 +3145,22 @@ class Notepad(QMainWindow):
         self._preview_timer.timeout.connect(self._refresh_markdown_preview)
         self._preview_live = True
         self._preview_stale = False
+        # Markdown→HTML conversion state shared by preview and PDF export:
+        # a lazily built markdown.Markdown converter (markdown.markdown()
+        # reassembles the whole extension pipeline per call; reset() is cheap)
+        # and a small LRU of recent renders keyed on a digest of the source,
+        # so re-exporting or re-showing unchanged text skips the parser and
+        # Pygments entirely.
+        self._md_converter = None
+        self._md_html_cache: OrderedDict[bytes, str] = OrderedDict()
+        # Plain-text snapshot shared within one quiet period: the status bar,
+        # preview refresh and PDF export each want the document as a str, and
+        # without the memo each call pays the full QString→str copy.  Any edit
+        # clears it via contentsChanged.
+        self._plain_cache: Optional[str] = None
+        # Digest of what was last exported to each PDF path, so re-exporting
+        # unchanged content to the same file skips pagination entirely.
+        self._pdf_export_cache: dict[str, bytes] = {}
 
         self.status = QStatusBar(self)
         self.setStatusBar(self.status)
@@ -2699,19 +3236,37 @@ class Notepad(QMainWindow):
         self._pending_update_version = None
 
         self.current_path = None
+        self._last_title = ""
         self._recovery_path: Optional[Path] = None
         self._recovery_in_progress = False
+        # Change-driven autosave: the timer is single-shot and armed on the
+        # clean→dirty transition, so a clean or idle editor schedules no
+        # periodic wakeups and never rewrites an unchanged file.
         self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        # Minute-scale deadline: second-aligned wakeups (VeryCoarseTimer) cost
+        # nothing in accuracy and keep the timer off the fine-grained queue.
+        self.autosave_timer.setTimerType(Qt.VeryCoarseTimer)
         self.autosave_timer.timeout.connect(self._autosave)
         self.autosave_enabled = False
+        # (length, hash) of the last snapshot handed to an autosave worker.
+        # Lets a tick whose content matches what is already on disk skip the
+        # whole write.  None means "disk content unknown" — set on dispatch,
+        # cleared whenever a write fails, is superseded, or the document
+        # identity changes (open / new / manual save).
+        self._last_autosave_sig = None
         
         # Keyboard layout switching state
         # Detect the current system layout without switching anything.
         self._current_layout = get_current_layout()  # 0 = English India, 1 = Tamil Anjal
-        self._ctrl_press_time = 0  # For double Ctrl detection
+        # Double-Ctrl detection: the single-shot timer IS the state.  It runs
+        # for 500 ms after a first bare Ctrl release; a second release while
+        # it is still active triggers the quick switch.  No wall-clock reads.
         self._ctrl_press_timer = QTimer(self)
         self._ctrl_press_timer.setSingleShot(True)
-        self._ctrl_press_timer.timeout.connect(self._reset_ctrl_press)
+        # ±5% slack on a 500 ms human-gesture window is imperceptible, and a
+        # coarse timer lets the OS batch the wakeup with others.
+        self._ctrl_press_timer.setTimerType(Qt.CoarseTimer)
         # True when Ctrl/Meta was held while a non-modifier key was pressed (i.e. used
         # as part of a chord like Cmd+S or Cmd+.).  The subsequent Ctrl/Meta release
         # must NOT be counted toward the double-Ctrl quick-switch detection.
@@ -2772,6 +3327,9 @@ class Notepad(QMainWindow):
         # Debounce expensive status computations during rapid typing/deletions.
         self._status_update_timer = QTimer(self)
         self._status_update_timer.setSingleShot(True)
+        # ±5% on a 250 ms debounce is invisible; a coarse timer lets the OS
+        # batch the wakeup with others instead of scheduling it precisely.
+        self._status_update_timer.setTimerType(Qt.CoarseTimer)
         self._status_update_timer.timeout.connect(self._update_status_bar)
 
         # Debounce word-highlight scans on selectionChanged (collapses drag bursts).
@@ -2843,9 +3401,9 @@ class Notepad(QMainWindow):
 
         self.new_window_act = QAction("New Window", self)
         if sys.platform == "darwin":
-            self.new_window_act.setShortcut(QKeySequence("Meta+Shift+N"))
+            self.new_window_act.setShortcut(QKeySequence(Qt.META | Qt.SHIFT | Qt.Key_N))
         else:
-            self.new_window_act.setShortcut(QKeySequence("Ctrl+Shift+N"))
+            self.new_window_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_N))
 
         self.open_act = QAction("Open…", self)
         self.open_act.setShortcut(QKeySequence.Open)  # Ctrl+O / Cmd+O
@@ -2854,7 +3412,7 @@ class Notepad(QMainWindow):
         self.save_act.setShortcut(QKeySequence.Save)  # Ctrl+S / Cmd+S
 
         self.save_as_act = QAction("Save &As…", self)
-        self.save_as_act.setShortcut(QKeySequence("Ctrl+Shift+S"))
+        self.save_as_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_S))
 
         self.export_text_pdf_act = QAction("Export Text to PDF…", self)
         self.export_md_pdf_act = QAction("Export Markdown to PDF…", self)
@@ -2862,13 +3420,13 @@ class Notepad(QMainWindow):
         # Markdown preview.  Qt maps Ctrl to Command automatically on macOS, so
         # one sequence gives Ctrl+Shift+M on Windows and Cmd+Shift+M on the Mac.
         self.markdown_preview_act = QAction("Preview", self, checkable=True)
-        self.markdown_preview_act.setShortcut(QKeySequence("Ctrl+Shift+M"))
+        self.markdown_preview_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_M))
         self.markdown_preview_act.setToolTip(
             "Show the rendered Markdown beside the editor.\n"
             "Drag the divider to resize. Available for .md files."
         )
         self.markdown_refresh_preview_act = QAction("Refresh Preview", self)
-        self.markdown_refresh_preview_act.setShortcut(QKeySequence("Ctrl+Shift+R"))
+        self.markdown_refresh_preview_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_R))
         self.markdown_refresh_preview_act.setToolTip(
             "Re-render the preview now. Used for large documents, where the "
             "preview stops updating as you type."
@@ -2876,7 +3434,7 @@ class Notepad(QMainWindow):
 
         self.exit_act = QAction("E&xit", self)
         if sys.platform == "win32":
-            self.exit_act.setShortcut(QKeySequence("Alt+F4"))
+            self.exit_act.setShortcut(QKeySequence(Qt.ALT | Qt.Key_F4))
         else:
             self.exit_act.setShortcut(QKeySequence.Quit)
 
@@ -2904,7 +3462,7 @@ class Notepad(QMainWindow):
         self.find_act.setShortcut(QKeySequence.Find)  # Ctrl+F / Cmd+F
 
         self.find_next_act = QAction("Find Next", self)
-        self.find_next_act.setShortcut(QKeySequence("F3"))  # F3
+        self.find_next_act.setShortcut(QKeySequence(Qt.Key_F3))  # F3
 
         self.replace_act = QAction("Replace…", self)
         self.replace_act.setShortcut(QKeySequence.Replace)  # Ctrl+H
@@ -2912,35 +3470,35 @@ class Notepad(QMainWindow):
         self.replace_all_act = QAction("Replace All…", self)
 
         self.goto_act = QAction("Go To…", self)
-        self.goto_act.setShortcut(QKeySequence("Ctrl+G"))
+        self.goto_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_G))
 
         self.time_date_act = QAction("Time/Date", self)
-        self.time_date_act.setShortcut(QKeySequence("F5"))
+        self.time_date_act.setShortcut(QKeySequence(Qt.Key_F5))
 
         self.search_web_act = QAction("Search with Google", self)
-        self.search_web_act.setShortcut(QKeySequence("Ctrl+E"))
+        self.search_web_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_E))
 
         self.collapse_blank_lines_act = QAction("Collapse Blank Lines", self)
         self.insert_blank_lines_act = QAction("Insert Blank Lines", self)
 
         # Insert - Markdown heading actions
         self.insert_h1_act = QAction("Heading 1", self)
-        self.insert_h1_act.setShortcut(QKeySequence("Ctrl+1"))
+        self.insert_h1_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_1))
         
         self.insert_h2_act = QAction("Heading 2", self)
-        self.insert_h2_act.setShortcut(QKeySequence("Ctrl+2"))
+        self.insert_h2_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_2))
         
         self.insert_h3_act = QAction("Heading 3", self)
-        self.insert_h3_act.setShortcut(QKeySequence("Ctrl+3"))
+        self.insert_h3_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_3))
         
         self.insert_h4_act = QAction("Heading 4", self)
-        self.insert_h4_act.setShortcut(QKeySequence("Ctrl+4"))
+        self.insert_h4_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_4))
         
         self.insert_h5_act = QAction("Heading 5", self)
-        self.insert_h5_act.setShortcut(QKeySequence("Ctrl+5"))
+        self.insert_h5_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_5))
         
         self.insert_h6_act = QAction("Heading 6", self)
-        self.insert_h6_act.setShortcut(QKeySequence("Ctrl+6"))
+        self.insert_h6_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_6))
         
         self.insert_ul_act = QAction("Unordered List", self)
         self.insert_ol_act = QAction("Ordered List", self)
@@ -2948,24 +3506,24 @@ class Notepad(QMainWindow):
         
         # Insert - Text formatting actions
         self.insert_emphasis_act = QAction("Emphasis (Italic)", self)
-        self.insert_emphasis_act.setShortcut(QKeySequence("Ctrl+I"))
+        self.insert_emphasis_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_I))
         
         self.insert_strong_act = QAction("Strong (Bold)", self)
-        self.insert_strong_act.setShortcut(QKeySequence("Ctrl+B"))
+        self.insert_strong_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_B))
         
         self.insert_strong_emphasis_act = QAction("Strong Emphasis (Bold Italic)", self)
-        self.insert_strong_emphasis_act.setShortcut(QKeySequence("Ctrl+Shift+B"))
+        self.insert_strong_emphasis_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_B))
         
         self.insert_highlight_act = QAction("Highlight", self)
         self.insert_strikethrough_act = QAction("Strikethrough", self)
         self.insert_quote_act = QAction("Quote", self)
         self.insert_code_block_act = QAction("Code Block", self)
-        self.insert_code_block_act.setShortcut(QKeySequence("Ctrl+Shift+K"))
+        self.insert_code_block_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_K))
         
         # Insert - Special insertions
         self.insert_image_act = QAction("Image...", self)
         self.insert_hyperlink_act = QAction("Hyperlink...", self)
-        self.insert_hyperlink_act.setShortcut(QKeySequence("Ctrl+K"))
+        self.insert_hyperlink_act.setShortcut(QKeySequence(Qt.CTRL | Qt.Key_K))
         
         # Insert - Other markdown features
         self.insert_hr_act = QAction("Horizontal Rule", self)
@@ -2977,7 +3535,7 @@ class Notepad(QMainWindow):
 
         self.line_numbers_act = QAction("Gutter Line Numbers", self, checkable=True)
         self.line_numbers_act.setChecked(True)
-        self.line_numbers_act.setShortcut(QKeySequence("Ctrl+Shift+L"))
+        self.line_numbers_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_L))
 
         # Status bar item visibility
         self.status_words_act = QAction("Word Count", self, checkable=True)
@@ -3011,12 +3569,30 @@ class Notepad(QMainWindow):
 
         self.font_act = QAction("Font…", self)
 
-        # Auto-save
+        # Auto-save.  One exclusive QActionGroup carrying the interval in each
+        # action's data(): mutual exclusion runs in C++ and a single slot
+        # replaces five per-interval lambdas.
+        self.autosave_group = QActionGroup(self)
+        self.autosave_group.setExclusive(True)
         self.autosave_disabled_act = QAction("Disabled", self, checkable=True)
         self.autosave_2min_act = QAction("Every 2 minutes", self, checkable=True)
         self.autosave_5min_act = QAction("Every 5 minutes", self, checkable=True)
         self.autosave_15min_act = QAction("Every 15 minutes", self, checkable=True)
         self.autosave_30min_act = QAction("Every 30 minutes", self, checkable=True)
+        for act, minutes in (
+            (self.autosave_disabled_act, 0),
+            (self.autosave_2min_act, 2),
+            (self.autosave_5min_act, 5),
+            (self.autosave_15min_act, 15),
+            (self.autosave_30min_act, 30),
+        ):
+            act.setData(minutes)
+            self.autosave_group.addAction(act)
+        # Interval → action lookup for _update_autosave_menu: checking the one
+        # matching action lets the exclusive group clear the rest in C++.
+        self._autosave_actions = {
+            act.data(): act for act in self.autosave_group.actions()
+        }
 
         # Settings
         self.appearance_act = QAction("Appearance...", self)
@@ -3036,6 +3612,13 @@ class Notepad(QMainWindow):
             "Uncheck to make Neight contact the network only when you ask it to."
         )
 
+        self.validate_urls_act = QAction("Validate URLs Online", self, checkable=True)
+        self.validate_urls_act.setChecked(True)  # default; overridden by _load_preferences
+        self.validate_urls_act.setToolTip(
+            "Checks image and hyperlink URLs with a quick HEAD request before inserting.\n"
+            "Uncheck to accept any well-formed URL instantly without touching the network."
+        )
+
         # Scroll bar
         self.auto_hide_scrollbar_act = QAction("Auto-Hide Scrollbar", self, checkable=True)
         self.auto_hide_scrollbar_act.setChecked(False)
@@ -3045,7 +3628,7 @@ class Notepad(QMainWindow):
         self.unicode_substring_highlight_act.setChecked(False)
         self.reading_time_act = QAction("Reading Time...", self)
         self.word_index_act = QAction("Word Index Overlay", self, checkable=True)
-        self.word_index_act.setShortcut(QKeySequence("Ctrl+Shift+W"))
+        self.word_index_act.setShortcut(QKeySequence(Qt.CTRL | Qt.SHIFT | Qt.Key_W))
         self.normalize_unicode_act = QAction("Normalize Unicode (NFC)", self)
 
         # Help
@@ -3228,6 +3811,7 @@ class Notepad(QMainWindow):
         settings_menu = menubar.addMenu("&Settings")
         settings_menu.addAction(self.reopen_last_act)
         settings_menu.addAction(self.update_check_act)
+        settings_menu.addAction(self.validate_urls_act)
         settings_menu.addSeparator()
         settings_menu.addAction(self.appearance_act)
         save_preset_menu = settings_menu.addMenu("Save Current Settings to")
@@ -3304,11 +3888,9 @@ class Notepad(QMainWindow):
         self.font_act.triggered.connect(self.change_font)
 
         # Auto-save
-        self.autosave_disabled_act.triggered.connect(lambda: self._set_autosave_interval(0))
-        self.autosave_2min_act.triggered.connect(lambda: self._set_autosave_interval(2))
-        self.autosave_5min_act.triggered.connect(lambda: self._set_autosave_interval(5))
-        self.autosave_15min_act.triggered.connect(lambda: self._set_autosave_interval(15))
-        self.autosave_30min_act.triggered.connect(lambda: self._set_autosave_interval(30))
+        self.autosave_group.triggered.connect(
+            lambda action: self._set_autosave_interval(action.data())
+        )
         self._autosave_succeeded.connect(self._on_autosave_success)
         self._autosave_failed.connect(self._on_autosave_failure)
         self._autosave_superseded.connect(self._on_autosave_superseded)
@@ -3318,6 +3900,7 @@ class Notepad(QMainWindow):
         # Watchdog: fires every minute to reset a stuck _autosave_in_progress
         # flag from a hung background thread (e.g. unresponsive NFS mount).
         self._autosave_watchdog = QTimer(self)
+        self._autosave_watchdog.setTimerType(Qt.VeryCoarseTimer)
         self._autosave_watchdog.setInterval(60_000)
         self._autosave_watchdog.timeout.connect(self._autosave_watchdog_check)
         self._autosave_watchdog.start()
@@ -3359,6 +3942,7 @@ class Notepad(QMainWindow):
         self.appearance_act.triggered.connect(self._show_appearance_dialog)
         self.reopen_last_act.toggled.connect(self._on_reopen_last_toggled)
         self.update_check_act.toggled.connect(self._on_update_check_toggled)
+        self.validate_urls_act.toggled.connect(self._on_validate_urls_toggled)
         self.keyboards_act.triggered.connect(self._show_keyboards_dialog)
 
         # Scroll bar
@@ -3393,6 +3977,7 @@ class Notepad(QMainWindow):
             pass
 
         # Status updates
+        self.editor.document().contentsChanged.connect(self._invalidate_plain_cache)
         self.editor.textChanged.connect(self._on_text_changed)
         self.editor.selectionChanged.connect(self._schedule_word_highlight_update)
         self.editor.cursorPositionChanged.connect(self._update_cursor_position_status)
@@ -3400,6 +3985,8 @@ class Notepad(QMainWindow):
 
         # Update window title on modification
         self.editor.modificationChanged.connect(self._update_title)
+        # Arm the change-driven autosave when the document turns dirty.
+        self.editor.modificationChanged.connect(self._on_modification_changed)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -3424,6 +4011,15 @@ class Notepad(QMainWindow):
             3000,
         )
 
+    def _on_validate_urls_toggled(self, checked: bool) -> None:
+        self._validate_urls_online = bool(checked)
+        self._save_preferences()
+        self.status.showMessage(
+            "URL validation: online" if checked
+            else "URL validation: format check only — inserts never wait on the network",
+            3000,
+        )
+
     def _run_startup_update_check(self):
         """Silent background check on startup — no UI feedback unless an update is found."""
         if not getattr(self, "_update_check_on_launch", True):
@@ -3462,21 +4058,21 @@ class Notepad(QMainWindow):
         We catch the chord at the application level here: any non-modifier
         KeyPress / ShortcutOverride with Ctrl or Meta held, AND any Shortcut
         event, marks the next Ctrl/Meta release as 'consumed by a chord' so it
-        is discarded by keyReleaseEvent.  We also reset _ctrl_press_time so a
-        previously-armed first tap can't combine with the post-chord release.
+        is discarded by keyReleaseEvent.  We also stop the detection timer so
+        a previously-armed first tap can't combine with the post-chord release.
         """
         try:
             etype = event.type()
             if etype == QEvent.Type.Shortcut:
                 self._ctrl_used_as_modifier = True
-                self._ctrl_press_time = 0
+                self._ctrl_press_timer.stop()
             elif etype in (QEvent.Type.KeyPress, QEvent.Type.ShortcutOverride):
                 key = event.key()
                 if key not in (Qt.Key_Control, Qt.Key_Meta, Qt.Key_Shift,
                                Qt.Key_Alt, Qt.Key_AltGr):
                     if event.modifiers() & (Qt.ControlModifier | Qt.MetaModifier):
                         self._ctrl_used_as_modifier = True
-                        self._ctrl_press_time = 0
+                        self._ctrl_press_timer.stop()
         except Exception:
             pass
         return super().eventFilter(watched, event)
@@ -3511,7 +4107,7 @@ class Notepad(QMainWindow):
             return
 
         # Only track double-Ctrl presses when quick switch is enabled
-        if event.key() in (Qt.Key_Control, Qt.Key_Meta):
+        if event.key() in (Qt.Key_Control, Qt.Key_Meta) and not event.isAutoRepeat():
             # If this release belongs to a chord (e.g. Cmd+S, Cmd+., Cmd+Z),
             # discard it — it must not count toward the double-Ctrl detection.
             if getattr(self, '_ctrl_used_as_modifier', False):
@@ -3519,44 +4115,47 @@ class Notepad(QMainWindow):
                 super().keyReleaseEvent(event)
                 return
             if getattr(self, '_quick_switch_enabled', False):
-                current_time = time.time()
-
-                # Second Ctrl release within 500 ms — trigger the switch
-                if self._ctrl_press_time > 0 and (current_time - self._ctrl_press_time) < 0.5:
+                # The single-shot timer is the whole state machine: active
+                # means a first bare release was seen within the last 500 ms.
+                if self._ctrl_press_timer.isActive():
                     self._quick_switch()
-                    self._ctrl_press_time = 0  # Reset
                     self._ctrl_press_timer.stop()
                 else:
                     # First Ctrl release — open the detection window
-                    self._ctrl_press_time = current_time
                     self._ctrl_press_timer.start(500)  # 500 ms timeout
 
         super().keyReleaseEvent(event)
 
     def _install_shortcuts(self):
-        sequences = (
-            (QKeySequence.ZoomIn, 1),
-            (QKeySequence(Qt.CTRL | Qt.Key_Plus), 1),
-            (QKeySequence(Qt.CTRL | Qt.Key_Equal), 1),
-            (QKeySequence("Ctrl++"), 1),
-            (QKeySequence("Ctrl+="), 1),
-            (QKeySequence.ZoomOut, -1),
-            (QKeySequence(Qt.CTRL | Qt.Key_Minus), -1),
-            (QKeySequence(Qt.CTRL | Qt.Key_Underscore), -1),
-            (QKeySequence("Ctrl+-"), -1),
-            (QKeySequence("Ctrl+_"), -1),
+        # One QAction per zoom direction, carrying every key variant via
+        # setShortcuts: each QShortcut used to add its own entry that Qt's
+        # shortcut map walked on every keypress, so ten registrations for two
+        # actions made input dispatch pay five times over.
+        zoom_bindings = (
+            (1, (
+                QKeySequence.ZoomIn,
+                QKeySequence(Qt.CTRL | Qt.Key_Plus),
+                QKeySequence(Qt.CTRL | Qt.Key_Equal),
+            )),
+            (-1, (
+                QKeySequence.ZoomOut,
+                QKeySequence(Qt.CTRL | Qt.Key_Minus),
+                QKeySequence(Qt.CTRL | Qt.Key_Underscore),
+            )),
         )
 
         self._font_shortcuts = []
-        for sequence, delta in sequences:
-            shortcut = QShortcut(sequence, self.editor)
-            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
-            shortcut.activated.connect(lambda d=delta: self._change_font_size(d))
-            self._font_shortcuts.append(shortcut)
+        for delta, sequences in zoom_bindings:
+            action = QAction(self.editor)
+            action.setShortcuts(sequences)
+            action.setShortcutContext(Qt.WidgetWithChildrenShortcut)
+            action.triggered.connect(lambda _=False, d=delta: self._change_font_size(d))
+            self.editor.addAction(action)
+            self._font_shortcuts.append(action)
 
         plain_paste_sequences = (
-            QKeySequence("Shift+Ctrl+V"),
-            QKeySequence("Shift+Insert"),
+            QKeySequence(Qt.SHIFT | Qt.CTRL | Qt.Key_V),
+            QKeySequence(Qt.SHIFT | Qt.Key_Insert),
         )
         self._plain_paste_shortcuts = []
         for sequence in plain_paste_sequences:
@@ -3571,12 +4170,12 @@ class Notepad(QMainWindow):
             return
         
         # Ctrl+, (comma) -> switch to English India
-        shortcut_comma = QShortcut(QKeySequence("Ctrl+,"), self)
+        shortcut_comma = QShortcut(QKeySequence(Qt.CTRL | Qt.Key_Comma), self)
         shortcut_comma.setContext(Qt.ApplicationShortcut)
         shortcut_comma.activated.connect(lambda: self._toggle_keyboard_layout(0))
         
         # Ctrl+. (period/fullstop) -> switch to Tamil Anjal
-        shortcut_period = QShortcut(QKeySequence("Ctrl+."), self)
+        shortcut_period = QShortcut(QKeySequence(Qt.CTRL | Qt.Key_Period), self)
         shortcut_period.setContext(Qt.ApplicationShortcut)
         shortcut_period.activated.connect(lambda: self._toggle_keyboard_layout(1))
 
@@ -3672,18 +4271,14 @@ class Notepad(QMainWindow):
             # Safety net: never let a quick-switch failure crash the app
             pass
 
-    def _reset_ctrl_press(self):
-        """Reset the Ctrl press counter."""
-        self._ctrl_press_time = 0
-
     def _update_export_menu_visibility(self):
         """Update export menu item visibility based on current file extension."""
         if self.current_path:
             ext = Path(self.current_path).suffix.lower()
             # Show "Export Text to PDF" only for .txt files
-            self.export_text_pdf_act.setVisible(ext == '.txt' or ext == '')
+            self.export_text_pdf_act.setVisible(ext in _TXT_EXTS)
             # Show "Export Markdown to PDF" only for .md files
-            self.export_md_pdf_act.setVisible(ext in ['.md', '.markdown'])
+            self.export_md_pdf_act.setVisible(ext in _MD_EXTS)
         else:
             # No file saved yet - hide both export options
             self.export_text_pdf_act.setVisible(False)
@@ -3703,6 +4298,7 @@ class Notepad(QMainWindow):
         self._source_encoding = ""
         self._source_had_bom = False
         self._source_newline = ""
+        self._last_autosave_sig = None
         self.editor.document().setModified(False)
         self._update_title()
         self._update_status_bar()
@@ -3789,7 +4385,15 @@ class Notepad(QMainWindow):
             return False
 
         try:
-            raw_bytes = path_obj.read_bytes()
+            # Map the file rather than read() it: the decodes below work
+            # straight out of the page cache, so the file's raw bytes are never
+            # duplicated into a Python bytes object alongside the decoded
+            # string.  Empty files cannot be mapped.
+            with open(path_obj, "rb") as fh:
+                raw_bytes = (
+                    mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    if file_size else b""
+                )
         except Exception as e:
             if notify_errors:
                 QMessageBox.critical(self, "Error", f"Could not open file:\n{e}")
@@ -3799,11 +4403,12 @@ class Notepad(QMainWindow):
         # bytes, so testing UTF-16 first would decode a UTF-32 file into garbage
         # rather than failing; and plain "utf-8" leaves a UTF-8 BOM in the text as
         # a stray U+FEFF, which used to show up as an invisible first character.
-        if raw_bytes.startswith(b"\xff\xfe\x00\x00") or raw_bytes.startswith(b"\x00\x00\xfe\xff"):
+        bom = bytes(raw_bytes[:4])
+        if bom.startswith(b"\xff\xfe\x00\x00") or bom.startswith(b"\x00\x00\xfe\xff"):
             candidates, had_bom = ("utf-32",), True
-        elif raw_bytes.startswith(b"\xff\xfe") or raw_bytes.startswith(b"\xfe\xff"):
+        elif bom.startswith(b"\xff\xfe") or bom.startswith(b"\xfe\xff"):
             candidates, had_bom = ("utf-16",), True
-        elif raw_bytes.startswith(b"\xef\xbb\xbf"):
+        elif bom.startswith(b"\xef\xbb\xbf"):
             candidates, had_bom = ("utf-8-sig",), True
         else:
             candidates, had_bom = ("utf-8", "utf-16", "utf-32"), False
@@ -3819,7 +4424,9 @@ class Notepad(QMainWindow):
         nul_fallback = None
         for enc in candidates:
             try:
-                decoded = raw_bytes.decode(enc)
+                # str(buffer, enc) decodes any bytes-like object, so the same
+                # line handles both the mmap and the empty-file b"".
+                decoded = str(raw_bytes, enc)
             except (UnicodeDecodeError, LookupError):
                 continue
             if "\x00" in decoded:
@@ -3838,6 +4445,8 @@ class Notepad(QMainWindow):
             break
         if text is None and nul_fallback is not None:
             text, source_encoding = nul_fallback
+        if isinstance(raw_bytes, mmap.mmap):
+            raw_bytes.close()
         if text is None:
             if notify_errors:
                 QMessageBox.critical(
@@ -3858,11 +4467,20 @@ class Notepad(QMainWindow):
         # setPlainText emits textChanged, which would schedule a status refresh and
         # a highlight scan over a file that may be up to _MAX_OPEN_FILE_BYTES.  The
         # explicit _update_status_bar() below already covers the status bar, and a
-        # freshly opened document has no selection to highlight.
+        # freshly opened document has no selection to highlight.  Repaints and the
+        # undo machinery are also switched off for the bulk insert: nothing useful
+        # can be painted mid-replace, and there is no point building an undo
+        # command for an insertion that setPlainText wipes from the history anyway.
+        # (Document signals stay live — the layout depends on contentsChange.)
         _blocked = self.editor.blockSignals(True)
+        doc = self.editor.document()
+        self.editor.setUpdatesEnabled(False)
+        doc.setUndoRedoEnabled(False)
         try:
             self.editor.setPlainText(text)
         finally:
+            doc.setUndoRedoEnabled(True)
+            self.editor.setUpdatesEnabled(True)
             self.editor.blockSignals(_blocked)
         self._clear_recovery_file()
         self._set_line_spacing_preset(getattr(self, '_line_spacing_preset', 'single_line'), save=False, show_status=False)
@@ -3870,6 +4488,7 @@ class Notepad(QMainWindow):
         self._source_had_bom = had_bom
         self._source_newline = source_newline
         self.current_path = str(path_obj)
+        self._last_autosave_sig = None
         self.editor.document().setModified(False)
         self._update_default_directory(path_obj.parent)
         self._update_title()
@@ -4018,7 +4637,7 @@ class Notepad(QMainWindow):
           only when a single word already exceeds 96 characters.
         """
         MAX_STEM = 96
-        words = self.editor.toPlainText().split()
+        words = self._plain_text().split()
         if not words:
             return ""
         candidates = words[:4]
@@ -4079,12 +4698,20 @@ class Notepad(QMainWindow):
             # used to skip both, making it less durable than autosave — and uses a
             # temp name unique per call, so it can no longer collide with the
             # autosave worker writing the same target.
-            _atomic_write_text(path_obj, self.editor.documentText())
+            # Manual save runs on the UI thread, so the document can be walked
+            # block by block and streamed into the temp file — no whole-document
+            # string snapshot.  (Autosave cannot do this: its write happens on a
+            # worker thread, and QTextDocument is not thread-safe, so it keeps
+            # taking a string snapshot up front.)
+            _atomic_write_text(path_obj, self.editor.documentChunks())
             # The file now matches what we write, so any pending conversion has
             # happened and must not be reported again.
             self._source_encoding = "utf-8"
             self._source_had_bom = False
             self._source_newline = self.NATIVE_NEWLINE
+            # Manual save wrote via documentChunks(), so no snapshot string was
+            # taken to fingerprint; the next autosave re-establishes it.
+            self._last_autosave_sig = None
             self.editor.document().setModified(False)
             self._clear_recovery_file()
             self._update_default_directory(path_obj.parent)
@@ -4109,21 +4736,38 @@ class Notepad(QMainWindow):
         if not self.current_path:
             if self.editor.document().isModified():
                 self._recovery_write()
+                # A recovery document stays dirty forever, so no modification
+                # transition will re-arm the single-shot timer — do it here so
+                # the recovery copy keeps refreshing while the user types.
+                self._arm_autosave_timer()
             return
         if not self.editor.document().isModified():
             return
         # Guard against overlapping writes (shouldn't happen at 2–30 min
         # intervals, but safe-guards against very slow filesystems).
         if getattr(self, '_autosave_in_progress', False):
+            self._arm_autosave_timer()
             return
 
         # Capture everything needed by the worker on the UI thread.
         text = self.editor.documentText()
         path = self.current_path
 
+        # A type-then-undo (or type-then-delete) round trip leaves the modified
+        # flag set with content identical to the last committed autosave.  Skip
+        # the rewrite: clear the flag and stop — the next real edit re-arms the
+        # timer via modificationChanged.
+        signature = (len(text), hash(text))
+        if signature == self._last_autosave_sig:
+            self.editor.document().setModified(False)
+            return
+
         # Optimistically clear the dirty flag now; restored on failure.
         self.editor.document().setModified(False)
         self._autosave_in_progress = True
+        # Recorded optimistically at dispatch; the failure / superseded /
+        # watchdog paths reset it to None because disk content is then unknown.
+        self._last_autosave_sig = signature
 
         # Record when this write started so the watchdog can detect hangs.
         self._autosave_started_at = time.monotonic()
@@ -4171,6 +4815,7 @@ class Notepad(QMainWindow):
         """
         self._autosave_in_progress = False
         self._autosave_started_at = 0.0
+        self._last_autosave_sig = None
         self._write_autosave_log(
             f"SUPERSEDED: autosave snapshot dropped, newer save won.  path={self.current_path!r}"
         )
@@ -4179,8 +4824,13 @@ class Notepad(QMainWindow):
         """Called on the UI thread after a failed background autosave."""
         self._autosave_in_progress = False
         self._autosave_started_at = 0.0
+        self._last_autosave_sig = None
         # Restore the dirty flag so the user is not left with an unsaved file.
         self.editor.document().setModified(True)
+        # setModified(True) only emits modificationChanged on a transition; if
+        # the user typed while the write was in flight the flag was already
+        # set, so schedule the retry explicitly.
+        self._arm_autosave_timer()
         self.status.showMessage("Auto-save failed — check disk or permissions", 3000)
         self._write_autosave_log(f"FAIL: {exc!r}  path={self.current_path!r}")
 
@@ -4208,7 +4858,7 @@ class Notepad(QMainWindow):
         # Generate a unique recovery path the first time we need it.
         if self._recovery_path is None:
             try:
-                folder = Path.home() / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
+                folder = _HOME / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
                 folder.mkdir(parents=True, exist_ok=True)
             except Exception:
                 return  # Cannot create folder — skip silently this tick
@@ -4266,7 +4916,7 @@ class Notepad(QMainWindow):
     def _view_recovery_folder(self):
         """Open the recovery folder in Finder (macOS) or Explorer (Windows)."""
         try:
-            folder = Path.home() / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
+            folder = _HOME / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
             folder.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             QMessageBox.warning(
@@ -4295,7 +4945,7 @@ class Notepad(QMainWindow):
         folder.  The file this window is currently writing to (if any) is
         never deleted.
         """
-        folder = Path.home() / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
+        folder = _HOME / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
         ret = QMessageBox.warning(
             self,
             "Empty Recovery Folder",
@@ -4357,7 +5007,11 @@ class Notepad(QMainWindow):
         if elapsed >= timeout_sec:
             self._autosave_in_progress = False
             self._autosave_started_at = 0.0
+            self._last_autosave_sig = None
             self.editor.document().setModified(True)
+            # As in _on_autosave_failure, the dirty flag may already have been
+            # set by typing, so re-arm the single-shot timer explicitly.
+            self._arm_autosave_timer()
             # Invalidate the hung worker's generation.  Clearing the boolean alone
             # let a new autosave start while the old thread was still alive; if the
             # old one finished last it replaced the file with an older snapshot.
@@ -4385,14 +5039,36 @@ class Notepad(QMainWindow):
         except Exception:
             pass
 
-    def _start_autosave(self):
+    def _on_modification_changed(self, modified: bool):
+        if modified:
+            self._arm_autosave_timer()
+
+    def _arm_autosave_timer(self):
+        """Schedule one autosave an interval from now, if one is due.
+
+        No-op unless autosave is enabled, the document is actually dirty and
+        nothing is already scheduled — so the delay runs from the first unsaved
+        edit and later keystrokes cannot postpone it indefinitely.
+        """
+        if not self.autosave_enabled or self.autosave_timer.isActive():
+            return
+        if not self.editor.document().isModified():
+            return
         interval = getattr(self, '_autosave_interval_minutes', 5)
         if interval > 0:
             self.autosave_timer.start(interval * 60 * 1000)
+
+    def _start_autosave(self):
+        interval = getattr(self, '_autosave_interval_minutes', 5)
+        if interval > 0:
+            # Drop any schedule made under an old interval, then arm only if
+            # the document is already dirty; otherwise the next clean→dirty
+            # transition arms it.  _autosave() handles both cases when it
+            # fires: writes to current_path when saved, or a recovery copy
+            # when the document is still unsaved.
+            self.autosave_timer.stop()
             self.autosave_enabled = True
-            # Note: the timer fires regardless of whether a file path is set.
-            # _autosave() handles both cases: writes to current_path when saved,
-            # or writes a recovery copy when the document is still unsaved.
+            self._arm_autosave_timer()
 
     def _stop_autosave(self):
         self.autosave_timer.stop()
@@ -4554,26 +5230,32 @@ class Notepad(QMainWindow):
         return found
 
     def _replace_all_occurrences(self, find_text: str, replace_text: str) -> int:
+        """Replace every occurrence in a single pass.
+
+        The old loop alternated doc.find() with a per-match insertText(), so Qt
+        re-walked the document from each fresh cursor and re-laid it out per
+        hit.  One C-level str.replace over the document text plus a single
+        whole-document insertText does the same work with one relayout, stays
+        one undo entry, and lets queries containing escaped newlines match
+        across line boundaries (doc.find never could).
+        """
+        text = self.editor.documentText()
+        count = text.count(find_text)
+        if not count:
+            return 0
+        new_text = text.replace(find_text, replace_text)
+
         cursor = self.editor.textCursor()
+        position = cursor.position()
         cursor.beginEditBlock()
-        cursor.movePosition(QTextCursor.Start)
-        self.editor.setTextCursor(cursor)
-
-        count = 0
-        doc = self.editor.document()
-
         try:
-            while True:
-                match = doc.find(find_text, cursor)
-                if match.isNull():
-                    break
-                match.insertText(replace_text)
-                cursor = match
-                count += 1
-                if count % 50 == 0:
-                    self.status.showMessage(f"Replacing… {count}", 0)
+            cursor.select(QTextCursor.Document)
+            cursor.insertText(new_text)
         finally:
             cursor.endEditBlock()
+        # Keep the caret near where the user left it, clamped to the new length.
+        cursor.setPosition(min(position, max(0, self.editor.document().characterCount() - 1)))
+        self.editor.setTextCursor(cursor)
         return count
 
     def _show_progress_indicator(self, message: str) -> None:
@@ -4607,7 +5289,7 @@ class Notepad(QMainWindow):
     def _normalize_selected_text(text: str) -> str:
         if not text:
             return ""
-        return text.replace("\u2029", "\n")
+        return _map_qt_line_seps(text)
 
     @staticmethod
     def _encode_special_sequences(text: str) -> str:
@@ -4664,34 +5346,54 @@ class Notepad(QMainWindow):
             return
 
         newline = "\r\n" if "\r\n" in text else "\n"
-        pattern = re.compile(r'(?:\r\n|\r|\n){2,}')
-        matches = list(pattern.finditer(text))
-        if not matches:
-            self.status.showMessage("No extra blank lines found", 2000)
-            return
-
         replacement = newline * 2
-        collapsed = pattern.sub(replacement, text)
         replacement_length = len(replacement)
-        adjustments = []
-        for match in matches:
+        # One fused pass: the sub callback emits the constant replacement AND
+        # records the shrinking spans as parallel arrays — starts, ends and the
+        # cumulative characters removed up to each span.  The regex scans the
+        # text once (a separate finditer + sub scanned it twice), and cursor
+        # remapping below can binary-search instead of scanning every span.
+        blocks_collapsed = 0
+        adj_starts: list[int] = []
+        adj_ends: list[int] = []
+        adj_cum: list[int] = []
+        removed = 0
+
+        def _record(match: re.Match) -> str:
+            nonlocal blocks_collapsed, removed
+            blocks_collapsed += 1
             start, end = match.span()
             diff = (end - start) - replacement_length
             if diff > 0:
-                adjustments.append((start, end, diff))
+                adj_starts.append(start)
+                adj_ends.append(end)
+                removed += diff
+                adj_cum.append(removed)
+            return replacement
+
+        collapsed = _BLANK_RUN_RE.sub(_record, text)
+        if not blocks_collapsed:
+            self.status.showMessage("No extra blank lines found", 2000)
+            return
 
         cursor = self.editor.textCursor()
         old_pos = cursor.position()
         old_anchor = cursor.anchor()
 
         def adjust_position(pos: int) -> int:
-            for start, end, diff in adjustments:
-                if pos > end:
-                    pos -= diff
-                elif start < pos <= end:
-                    pos = start + replacement_length
-                    break
-            return pos
+            """Map a pre-collapse position into the collapsed text, O(log K).
+
+            All comparisons happen in the original text's coordinates; the
+            cumulative-removal array converts to new coordinates at the end.
+            """
+            # Spans strictly before pos (their end < pos) are fully removed
+            # ahead of it; a span containing pos clamps it to the end of that
+            # span's replacement.
+            i = bisect.bisect_left(adj_ends, pos)
+            shift = adj_cum[i - 1] if i else 0
+            if i < len(adj_starts) and adj_starts[i] < pos:
+                return adj_starts[i] - shift + replacement_length
+            return pos - shift
 
         new_pos = adjust_position(old_pos)
         new_anchor = adjust_position(old_anchor)
@@ -4714,7 +5416,6 @@ class Notepad(QMainWindow):
         restored_cursor.setPosition(new_pos, mode)
         self.editor.setTextCursor(restored_cursor)
 
-        blocks_collapsed = len(matches)
         self.status.showMessage(f"Collapsed {blocks_collapsed} blank block(s)", 3000)
 
     def insert_blank_lines(self):
@@ -4751,15 +5452,22 @@ class Notepad(QMainWindow):
         if not ok or not line_str.strip().isdigit():
             return
         line = max(1, int(line_str.strip()))
-        block = self.editor.document().findBlockByNumber(line - 1)
-        if block.isValid():
-            cursor = self.editor.textCursor()
-            cursor.setPosition(block.position())
-            self.editor.setTextCursor(cursor)
-            self.editor.centerCursor()
+        doc = self.editor.document()
+        cursor = self.editor.textCursor()
+        if line > doc.blockCount():
+            # findBlockByNumber walks the block list from the start, so a
+            # number past the end would traverse every block only to return an
+            # invalid one.  Check the count (O(1)) and jump straight to the end.
+            cursor.movePosition(QTextCursor.End)
+        else:
+            cursor.setPosition(doc.findBlockByNumber(line - 1).position())
+        self.editor.setTextCursor(cursor)
+        self.editor.centerCursor()
 
     def insert_time_date(self):
-        now = datetime.now().strftime("%H:%M %d-%m-%Y")  # similar to Notepad style
+        # time.strftime formats the current local time directly, skipping the
+        # datetime object datetime.now() would allocate just to discard.
+        now = time.strftime("%H:%M %d-%m-%Y")  # similar to Notepad style
         self.editor.insertPlainText(now)
 
     # --- Markdown insertion methods ---
@@ -4767,18 +5475,21 @@ class Notepad(QMainWindow):
         """Remove existing markdown tags at the start of the line."""
         cursor.movePosition(QTextCursor.StartOfBlock)
         cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
-        line_text = cursor.selectedText()
-        
-        # Patterns to remove: headings (#), lists (-, 1.), checkboxes (- [ ])
-        # Remove heading markers (1-6 # symbols followed by space)
-        cleaned = re.sub(r'^#{1,6}\s+', '', line_text)
-        # Remove unordered list marker (- followed by space)
-        cleaned = re.sub(r'^-\s+', '', cleaned)
-        # Remove ordered list marker (number followed by . and space)
-        cleaned = re.sub(r'^\d+\.\s+', '', cleaned)
-        # Remove checkbox marker (- [ ] or - [x])
-        cleaned = re.sub(r'^-\s+\[[xX\s]\]\s+', '', cleaned)
-        
+        cleaned = cursor.selectedText()
+
+        # Every pattern below is anchored to the first character and starts
+        # with '#', '-' or a digit, so a plain line (the common case when the
+        # user applies a marker to fresh text) can skip the regex machinery
+        # after one character test.
+        if not cleaned or cleaned[0] not in '#-0123456789':
+            return cleaned
+
+        # Patterns to remove: headings (#), lists (-, 1.), checkboxes (- [ ]).
+        # Compiled once at module scope — these run on every heading/list
+        # shortcut, so the per-call re-cache lookups added up.
+        for pattern in _MD_LINE_START_RES:
+            cleaned = pattern.sub('', cleaned)
+
         return cleaned
     
     def _insert_heading(self, level: int):
@@ -4828,21 +5539,11 @@ class Notepad(QMainWindow):
 
     def _remove_text_formatting(self, text: str) -> str:
         """Remove existing markdown formatting from text."""
-        # Remove in order from most specific to least specific
-        # Remove triple asterisks (strong emphasis)
-        cleaned = re.sub(r'\*\*\*(.*?)\*\*\*', r'\1', text)
-        # Remove double asterisks (strong/bold)
-        cleaned = re.sub(r'\*\*(.*?)\*\*', r'\1', cleaned)
-        # Remove single asterisks (emphasis/italic)
-        cleaned = re.sub(r'\*(.*?)\*', r'\1', cleaned)
-        # Remove double equals (highlight)
-        cleaned = re.sub(r'==(.*?)==', r'\1', cleaned)
-        # Remove double tildes (strikethrough)
-        cleaned = re.sub(r'~~(.*?)~~', r'\1', cleaned)
-        # Remove triple backticks (code blocks)
-        cleaned = re.sub(r'```(.*?)```', r'\1', cleaned, flags=re.DOTALL)
-        # Remove single backticks (inline code)
-        cleaned = re.sub(r'`(.*?)`', r'\1', cleaned)
+        # _MD_INLINE_RES is ordered from most to least specific; patterns are
+        # compiled once at module scope.
+        cleaned = text
+        for pattern in _MD_INLINE_RES:
+            cleaned = pattern.sub(r'\1', cleaned)
         return cleaned
     
     def _wrap_selection(self, prefix: str, suffix: str = None):
@@ -4890,25 +5591,23 @@ class Notepad(QMainWindow):
         cursor = self.editor.textCursor()
         
         if cursor.hasSelection():
-            # Handle multiple lines
+            # Handle multiple lines: widen the selection to whole blocks, build
+            # the quoted text in Python, and splice it back with one insertText.
+            # The old per-block insertText loop made Qt re-split and re-layout
+            # once per line inside the edit block; this runs the splitter once.
             start = cursor.selectionStart()
             end = cursor.selectionEnd()
-            
-            cursor.setPosition(start)
-            cursor.movePosition(QTextCursor.StartOfBlock)
-            start_block = cursor.blockNumber()
-            
-            cursor.setPosition(end)
-            end_block = cursor.blockNumber()
-            
+
             cursor.setPosition(start)
             cursor.movePosition(QTextCursor.StartOfBlock)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+
+            # selectedText() separates blocks with U+2029; insertText turns
+            # "\n" back into block breaks.
+            lines = _map_qt_line_seps(cursor.selectedText()).split("\n")
             cursor.beginEditBlock()
-            
-            for _ in range(end_block - start_block + 1):
-                cursor.insertText("> ")
-                cursor.movePosition(QTextCursor.NextBlock)
-            
+            cursor.insertText("\n".join("> " + line for line in lines))
             cursor.endEditBlock()
         else:
             # Single line
@@ -4922,9 +5621,7 @@ class Notepad(QMainWindow):
         cursor = self.editor.textCursor()
         
         if cursor.hasSelection():
-            selected_text = cursor.selectedText()
-            # Replace paragraph separator with newline
-            selected_text = selected_text.replace("\u2029", "\n")
+            selected_text = _map_qt_line_seps(cursor.selectedText())
             code_block = f"```\n{selected_text}\n```"
             cursor.insertText(code_block)
         else:
@@ -4944,10 +5641,10 @@ class Notepad(QMainWindow):
             url = url_input.text().strip()
             if not url:
                 status_label.setText("Please enter a URL")
-                status_label.setStyleSheet("color: red;")
+                _set_status_color(status_label, _QSS_STATUS_RED)
                 return
             status_label.setText("Validating…")
-            status_label.setStyleSheet("color: blue;")
+            _set_status_color(status_label, _QSS_STATUS_BLUE)
             insert_btn.setEnabled(False)
             if validate_btn is not None:
                 validate_btn.setEnabled(False)
@@ -4974,15 +5671,23 @@ class Notepad(QMainWindow):
                 if is_valid:
                     validated_url[0] = result
                     status_label.setText("✓ URL is valid")
-                    status_label.setStyleSheet("color: green;")
+                    _set_status_color(status_label, _QSS_STATUS_GREEN)
                     insert_btn.setEnabled(True)
                 else:
                     validated_url[0] = None
                     status_label.setText(f"✗ {result}")
-                    status_label.setStyleSheet("color: red;")
+                    _set_status_color(status_label, _QSS_STATUS_RED)
 
             timer.timeout.connect(_check)
             timer.start()
+
+        # Any edit invalidates the previous result, so insert() can trust a
+        # non-None validated_url[0] without re-reading the line edit — and a
+        # URL edited after validation can no longer insert the stale value.
+        def _invalidate(_text):
+            validated_url[0] = None
+
+        url_input.textChanged.connect(_invalidate)
         return validate
 
     def _validate_url(self, url: str) -> tuple[bool, str]:
@@ -5007,7 +5712,13 @@ class Notepad(QMainWindow):
             parsed = urlparse(url)
             if not parsed.netloc:
                 return False, "Invalid URL format"
-            
+
+            # Settings › Validate URLs Online unchecked: the syntactic check
+            # above is the whole validation — no DNS lookup, no TLS handshake,
+            # no 5 s timeout.  Bad URLs then surface at render time instead.
+            if not getattr(self, '_validate_urls_online', True):
+                return True, url
+
             # Try to connect
             req = urllib.request.Request(url, method='HEAD')
             req.add_header('User-Agent', 'Mozilla/5.0')
@@ -5050,7 +5761,7 @@ class Notepad(QMainWindow):
         
         # Status label
         status_label = QLabel("", dialog)
-        status_label.setStyleSheet("color: red;")
+        _set_status_color(status_label, _QSS_STATUS_RED)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -5076,16 +5787,17 @@ class Notepad(QMainWindow):
         validate = self._create_url_validate_fn(url_input, status_label, validated_url, insert_btn, validate_btn)
         
         def insert():
-            url = url_input.text().strip()
             alt = alt_input.text().strip()
-            
-            if not url:
-                status_label.setText("Please enter a URL")
-                status_label.setStyleSheet("color: red;")
-                return
-            
-            # If not validated yet, validate now
+
+            # If not validated yet, validate now.  A completed validation
+            # already stripped and normalised the URL (and any later edit
+            # cleared it), so the validated path re-reads nothing.
             if validated_url[0] is None:
+                url = url_input.text().strip()
+                if not url:
+                    status_label.setText("Please enter a URL")
+                    _set_status_color(status_label, _QSS_STATUS_RED)
+                    return
                 is_valid, result = self._validate_url(url)
                 if is_valid:
                     validated_url[0] = result
@@ -5138,7 +5850,7 @@ class Notepad(QMainWindow):
         
         # Status label
         status_label = QLabel("", dialog)
-        status_label.setStyleSheet("color: red;")
+        _set_status_color(status_label, _QSS_STATUS_RED)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -5165,18 +5877,16 @@ class Notepad(QMainWindow):
         
         def insert():
             text = text_input.text().strip()
-            url = url_input.text().strip()
-            
-            if not url:
-                status_label.setText("Please enter a URL")
-                status_label.setStyleSheet("color: red;")
-                return
-            
-            if not text:
-                text = url
-            
-            # If not validated yet, validate now
+
+            # If not validated yet, validate now.  A completed validation
+            # already stripped and normalised the URL (and any later edit
+            # cleared it), so the validated path re-reads nothing.
             if validated_url[0] is None:
+                url = url_input.text().strip()
+                if not url:
+                    status_label.setText("Please enter a URL")
+                    _set_status_color(status_label, _QSS_STATUS_RED)
+                    return
                 is_valid, result = self._validate_url(url)
                 if is_valid:
                     validated_url[0] = result
@@ -5192,6 +5902,9 @@ class Notepad(QMainWindow):
                         return
                     validated_url[0] = url if url.startswith(("http://", "https://")) else ("https://" + url)
             
+            if not text:
+                text = validated_url[0]
+
             # Insert markdown - replace selection or insert at cursor
             markdown = f"[{text}]({validated_url[0]})"
             cursor = self.editor.textCursor()
@@ -5225,7 +5938,7 @@ class Notepad(QMainWindow):
         # Check if current file is .txt
         if self.current_path:
             ext = Path(self.current_path).suffix.lower()
-            if ext not in ['.txt', '']:
+            if ext not in _TXT_EXTS:
                 QMessageBox.information(
                     self,
                     "Export Text to PDF",
@@ -5254,42 +5967,16 @@ class Notepad(QMainWindow):
             QMessageBox.critical(self, "Export Failed",
                                  "PDF export requires QtPrintSupport, which is not available.")
             return
-        
-        try:
-            # Create printer
-            printer = QPrinter(QPrinter.HighResolution)
-            printer.setOutputFormat(QPrinter.PdfFormat)
-            printer.setOutputFileName(save_path)
-            printer.setPageSize(QPageSize(QPageSize.A4))
-            # Set margins: left, top, right, bottom in millimeters
-            margins = QMarginsF(15, 20, 15, 20)
-            printer.setPageMargins(margins, _MARGIN_UNIT_MM)
-            
-            # Create document
-            doc = QTextDocument()
-            doc.setDefaultFont(self.editor.font())
-            
-            # Build content with header
-            content = ""
-            if self.current_path:
-                filename = Path(self.current_path).name
-                content = f"{filename}\n{'─' * 80}\n\n"
-            
-            content += self.editor.toPlainText()
-            doc.setPlainText(content)
-            
-            # Print to PDF
-            doc.print_(printer)
-            
-            self.status.showMessage(f"Exported to: {save_path}", 3000)
-            self._show_export_success_dialog("Text file", save_path)
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Export Failed",
-                f"Could not export to PDF:\n{str(e)}"
-            )
+
+        # The filename header travels separately so the body can stay the
+        # memoized snapshot instead of a second concatenated full-document copy.
+        header = ""
+        if self.current_path:
+            filename = Path(self.current_path).name
+            header = f"{filename}\n{'─' * 80}\n\n"
+
+        self._start_pdf_export(save_path, kind="Text file",
+                               plain_text=self._plain_text(), text_header=header)
 
     def _show_export_success_dialog(self, export_label: str, save_path: str, note: str = ""):
         """Show export success dialog with quick path actions."""
@@ -5363,6 +6050,11 @@ class Notepad(QMainWindow):
     # a debounced preview cannot stall the UI thread on a big document.
     PREVIEW_LIVE_LIMIT_CHARS = 200_000
 
+    # Rendered-HTML LRU depth.  Four entries cover the common toggle patterns
+    # (current text, the pre-edit text, export vs preview) without letting
+    # multi-megabyte renders of abandoned revisions pile up.
+    _MD_HTML_CACHE_MAX = 4
+
     @staticmethod
     def _markdown_task_lists_to_symbols(html_text: str) -> str:
         """Render GitHub task list markers as check boxes.
@@ -5388,15 +6080,29 @@ class Notepad(QMainWindow):
         print-oriented palette.  Returns None when the markdown package is
         unavailable, letting the caller fall back.
         """
-        try:
-            import markdown
-        except ImportError:
+        if not HAS_MARKDOWN:
             return None
 
-        html_content = markdown.markdown(
-            markdown_text, extensions=list(self.MARKDOWN_EXTENSIONS)
-        )
-        html_content = self._markdown_task_lists_to_symbols(html_content)
+        # The extensions are a class constant, so the source digest alone keys
+        # the cache.  Hits make toggling the preview, re-exporting, and the
+        # theme-only re-renders below free of parser work.
+        key = hashlib.blake2b(markdown_text.encode("utf-8"), digest_size=16).digest()
+        html_content = self._md_html_cache.get(key)
+        if html_content is None:
+            if self._md_converter is None:
+                self._md_converter = markdown.Markdown(
+                    extensions=list(self.MARKDOWN_EXTENSIONS)
+                )
+            else:
+                self._md_converter.reset()
+            html_content = self._markdown_task_lists_to_symbols(
+                self._md_converter.convert(markdown_text)
+            )
+            self._md_html_cache[key] = html_content
+            if len(self._md_html_cache) > self._MD_HTML_CACHE_MAX:
+                self._md_html_cache.popitem(last=False)
+        else:
+            self._md_html_cache.move_to_end(key)
 
         font = self.editor.font()
         family = font.family()
@@ -5431,24 +6137,12 @@ class Notepad(QMainWindow):
         # Qt's rich text supports roughly HTML4 + CSS 2.1.  Notably border-left
         # is ignored, so a blockquote is marked with a background tint and an
         # indent rather than the usual left bar.
-        return f"""<html><head><style>
-body {{ font-family: {family}; font-size: {size_pt}pt; color: {fg}; }}
-h1 {{ font-size: 2em; margin-top: 0.67em; margin-bottom: 0.67em; }}
-h2 {{ font-size: 1.5em; margin-top: 0.83em; margin-bottom: 0.83em; }}
-h3 {{ font-size: 1.17em; margin-top: 1em; margin-bottom: 1em; }}
-a {{ color: {link}; }}
-code {{ background-color: {code_bg}; padding: 2px 4px; font-family: monospace; }}
-pre {{ background-color: {code_bg}; padding: 10px; }}
-blockquote {{ background-color: {code_bg}; color: {muted};
-              margin-left: 0px; padding-left: 12px; padding-right: 12px; }}
-hr {{ height: 1px; background-color: {rule}; }}
-table {{ border-collapse: collapse; width: 100%; margin: 1em 0; }}
-th, td {{ border: 1px solid {border}; padding: 8px; text-align: left; }}
-th {{ background-color: {table_head_bg}; }}
-{highlight_css}
-</style></head><body>
-{html_content}
-</body></html>"""
+        return _MD_STYLED_HTML_TMPL.format_map({
+            "family": family, "size_pt": size_pt, "fg": fg, "link": link,
+            "code_bg": code_bg, "muted": muted, "rule": rule,
+            "border": border, "table_head_bg": table_head_bg,
+            "highlight_css": highlight_css, "body": html_content,
+        })
 
     # ------------------------------------------------------------------
     # Markdown preview (split view)
@@ -5462,7 +6156,7 @@ th {{ background-color: {table_head_bg}; }}
         """
         if not self.current_path:
             return False
-        return Path(self.current_path).suffix.lower() in ('.md', '.markdown')
+        return Path(self.current_path).suffix.lower() in _MD_EXTS
 
     def _toggle_markdown_preview(self, enabled: bool) -> None:
         """Show or hide the preview pane and remember the choice."""
@@ -5525,7 +6219,7 @@ th {{ background-color: {table_head_bg}; }}
         """Re-render the preview from the current editor contents."""
         if not self._markdown_preview_visible:
             return
-        text = self.editor.toPlainText()
+        text = self._plain_text()
 
         # Decide live vs on-demand from the document size, and say so once.
         was_live = self._preview_live
@@ -5594,7 +6288,7 @@ th {{ background-color: {table_head_bg}; }}
         # Check if current file is .md
         if self.current_path:
             ext = Path(self.current_path).suffix.lower()
-            if ext not in ['.md', '.markdown']:
+            if ext not in _MD_EXTS:
                 QMessageBox.information(
                     self,
                     "Export Markdown to PDF",
@@ -5620,116 +6314,66 @@ th {{ background-color: {table_head_bg}; }}
             return
 
         try:
-            # Try to import markdown library
-            try:
-                import markdown
-                has_markdown = True
-            except ImportError:
-                has_markdown = False
+            has_markdown = HAS_MARKDOWN
             
             if not HAS_PRINT_SUPPORT:
                 QMessageBox.critical(self, "Export Failed",
                                      "PDF export requires QtPrintSupport, which is not available.")
                 return
-            
-            # Create printer
-            printer = QPrinter(QPrinter.HighResolution)
-            printer.setOutputFormat(QPrinter.PdfFormat)
-            printer.setOutputFileName(save_path)
-            printer.setPageSize(QPageSize(QPageSize.A4))
-            # Set margins: left, top, right, bottom in millimeters
-            margins = QMarginsF(15, 20, 15, 20)
-            printer.setPageMargins(margins, _MARGIN_UNIT_MM)
-            
-            # Create document
-            doc = QTextDocument()
-            doc.setDefaultFont(self.editor.font())
-            
-            markdown_text = self.editor.toPlainText()
-            
+
+            markdown_text = self._plain_text()
+
             styled_html = (
                 self._markdown_to_styled_html(markdown_text, for_screen=False)
                 if has_markdown else None
             )
-            if styled_html is not None:
-                # Same renderer the on-screen preview uses, so the PDF cannot
-                # disagree with what the user just previewed.
-                doc.setHtml(styled_html)
-            else:
+            # styled_html is the same renderer the on-screen preview uses, so
+            # the PDF cannot disagree with what the user just previewed.
+            if styled_html is None:
                 # Fallback: simple text with basic markdown rendering
                 # This is a simplified version if markdown library is not available
                 lines = markdown_text.split('\n')
-                html_lines = []
-                
-                for line in lines:
+                # Preallocated and index-assigned: exactly one line of output
+                # per input line, so the list never grows mid-loop.
+                html_lines = [''] * len(lines)
+
+                for idx, line in enumerate(lines):
                     # HTML-escape content so user text cannot corrupt PDF HTML structure.
                     # html.escape does not affect markdown syntax chars (*, #, ~, `).
                     safe = html.escape(line)
-                    # Headers
-                    if safe.startswith('######'):
-                        html_lines.append(f'<h6>{safe[6:].strip()}</h6>')
-                    elif safe.startswith('#####'):
-                        html_lines.append(f'<h5>{safe[5:].strip()}</h5>')
-                    elif safe.startswith('####'):
-                        html_lines.append(f'<h4>{safe[4:].strip()}</h4>')
-                    elif safe.startswith('###'):
-                        html_lines.append(f'<h3>{safe[3:].strip()}</h3>')
-                    elif safe.startswith('##'):
-                        html_lines.append(f'<h2>{safe[2:].strip()}</h2>')
-                    elif safe.startswith('#'):
-                        html_lines.append(f'<h1>{safe[1:].strip()}</h1>')
-                    # Horizontal rule
-                    elif safe.strip() in ['---', '***', '___']:
-                        html_lines.append('<hr>')
+                    stripped = safe.strip()
+                    # Headers — one match replaces the old six-way startswith ladder.
+                    heading = _FB_MD_HEADING_RE.match(safe)
+                    if heading:
+                        level = len(heading.group(1))
+                        html_lines[idx] = (
+                            f'<h{level}>{heading.group(2).strip()}</h{level}>'
+                        )
+                    # Horizontal rule (three or more -, * or _, per markdown)
+                    elif _FB_MD_HR_RE.match(stripped):
+                        html_lines[idx] = '<hr>'
                     # Lists
-                    elif safe.strip().startswith('- '):
-                        html_lines.append(f'<li>{safe.strip()[2:]}</li>')
-                    # Bold italic
-                    elif '***' in safe:
-                        safe = re.sub(r'\*\*\*(.*?)\*\*\*', r'<strong><em>\1</em></strong>', safe)
-                        html_lines.append(f'<p>{safe}</p>')
-                    # Bold
-                    elif '**' in safe:
-                        safe = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', safe)
-                        html_lines.append(f'<p>{safe}</p>')
-                    # Italic
-                    elif '*' in safe:
-                        safe = re.sub(r'\*(.*?)\*', r'<em>\1</em>', safe)
-                        html_lines.append(f'<p>{safe}</p>')
+                    elif stripped.startswith('- '):
+                        html_lines[idx] = f'<li>{stripped[2:]}</li>'
+                    elif stripped:
+                        # Inline emphasis in a single scan of the line.
+                        html_lines[idx] = f'<p>{_fb_md_inline(safe)}</p>'
                     else:
-                        if safe.strip():
-                            html_lines.append(f'<p>{safe}</p>')
-                        else:
-                            html_lines.append('<br>')
+                        html_lines[idx] = '<br>'
                 
-                basic_html = f"""
-                <html>
-                <head>
-                    <style>
-                        body {{ font-family: {self.editor.font().family()}; font-size: {self.editor.font().pointSize()}pt; }}
-                        h1 {{ font-size: 2em; }}
-                        h2 {{ font-size: 1.5em; }}
-                        h3 {{ font-size: 1.17em; }}
-                    </style>
-                </head>
-                <body>
-                    {''.join(html_lines)}
-                </body>
-                </html>
-                """
-                doc.setHtml(basic_html)
-            
-            # Print to PDF
-            doc.print_(printer)
-            
-            self.status.showMessage(f"Exported to: {save_path}", 3000)
-            
+                styled_html = _MD_FALLBACK_HTML_TMPL.format_map({
+                    "family": self.editor.font().family(),
+                    "size_pt": self.editor.font().pointSize(),
+                    "body": ''.join(html_lines),
+                })
+
             msg = ""
             if not has_markdown:
                 msg = "Note: For better markdown rendering, install the 'markdown' package:\npip install markdown"
 
-            self._show_export_success_dialog("Markdown file", save_path, msg)
-            
+            self._start_pdf_export(save_path, kind="Markdown file",
+                                   html=styled_html, note=msg)
+
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -5737,6 +6381,63 @@ th {{ background-color: {table_head_bg}; }}
                 f"Could not export to PDF:\n{str(e)}"
             )
 
+    def _start_pdf_export(self, save_path: str, *, kind: str, html: str = "",
+                          plain_text: str = "", text_header: str = "",
+                          note: str = "") -> None:
+        """Hand the paginate-and-write step to a _PdfExportWorker thread.
+
+        Both export actions are disabled until the worker reports back, so two
+        exports can never race on the same output file; the progress indicator
+        covers the gap since the window stays fully interactive.
+        """
+        font = self.editor.font()
+        # Everything that shapes the output is either in the payload (the
+        # styled HTML embeds its CSS) or in the font settings, so digesting
+        # payload + font identifies the PDF exactly.  A match against what was
+        # last written to this path means the file on disk is already current.
+        digest = hashlib.blake2b(
+            f"{font.family()}|{font.pointSize()}|{text_header}".encode("utf-8")
+            + (html or plain_text).encode("utf-8"),
+            digest_size=16,
+        ).digest()
+        if (self._pdf_export_cache.get(save_path) == digest
+                and Path(save_path).exists()):
+            self.status.showMessage(f"PDF already up to date: {save_path}", 3000)
+            return
+        self.export_text_pdf_act.setEnabled(False)
+        self.export_md_pdf_act.setEnabled(False)
+        self._show_progress_indicator("Exporting PDF…")
+        worker = _PdfExportWorker(
+            self, save_path, html=html, plain_text=plain_text,
+            text_header=text_header, font_family=font.family(),
+            font_point_size=font.pointSize() if font.pointSize() > 0 else 12,
+        )
+        # Keep a reference while it runs; QThread must outlive run().
+        self._pdf_export_worker = worker
+        worker.result_ready.connect(
+            lambda path, error: self._on_pdf_export_done(path, error, kind, note, digest)
+        )
+        worker.start()
+
+    def _on_pdf_export_done(self, save_path: str, error: str,
+                            kind: str, note: str, digest: bytes) -> None:
+        """Called on the UI thread when the export worker finishes."""
+        self._pdf_export_worker = None
+        self.export_text_pdf_act.setEnabled(True)
+        self.export_md_pdf_act.setEnabled(True)
+        if not error:
+            self._pdf_export_cache[save_path] = digest
+        if error:
+            self._hide_progress_indicator()
+            QMessageBox.critical(
+                self,
+                "Export Failed",
+                f"Could not export to PDF:\n{error}"
+            )
+            return
+        self._hide_progress_indicator(f"Exported to: {save_path}", 3000)
+        self._show_export_success_dialog(kind, save_path, note)
+
     def show_about(self):
         msg = QMessageBox(self)
         msg.setWindowTitle("About")
@@ -6416,7 +7117,6 @@ th {{ background-color: {table_head_bg}; }}
             self._force_anjal_english = new_force
 
             if not new_qs:
-                self._ctrl_press_time = 0
                 try:
                     self._ctrl_press_timer.stop()
                 except Exception:
@@ -7291,6 +7991,7 @@ th {{ background-color: {table_head_bg}; }}
         except Exception:
             self._installed_imes = []
         _init_keyboard_choices(self._installed_imes)
+        preload_layout_hkls()
         ime_count = len(self._installed_imes)
         if ime_count < 2:
             # Nothing to switch between, so the stored preference is irrelevant.
@@ -7425,7 +8126,28 @@ th {{ background-color: {table_head_bg}; }}
         ))
         self._sync_action_checked(self.update_check_act, self._update_check_on_launch)
 
+        # Same fallback rule as above: a preset file without the key keeps the
+        # user's current choice rather than silently re-enabling network use.
+        self._validate_urls_online = bool(data.get(
+            "validate_urls_online", getattr(self, "_validate_urls_online", True)
+        ))
+        self._sync_action_checked(self.validate_urls_act, self._validate_urls_online)
+
     # --- Preferences ---
+    def _restore_last_file(self, path: str) -> None:
+        """Open the remembered session file, posted after the first paint."""
+        self.status.clearMessage()
+        # If anything reached the editor before this queued call ran — a file
+        # open, typing, text set programmatically — the session file must not
+        # replace it.
+        if (
+            self.current_path
+            or self.editor.document().isModified()
+            or not self.editor.document().isEmpty()
+        ):
+            return
+        self._open_file_path(path, notify_errors=False, show_status=False)
+
     def _load_preferences(self):
         data = self.settings.load()
 
@@ -7484,9 +8206,11 @@ th {{ background-color: {table_head_bg}; }}
                 try:
                     self.default_directory = Path(default_dir)
                 except Exception:
-                    self.default_directory = Path.home()
+                    self.default_directory = _HOME
         else:
-            self.default_directory = Path.home()
+            self.default_directory = _HOME
+        # default_directory may have changed out from under the fspath cache.
+        self._last_default_dir_arg = None
 
         size_info = data.get("window_size") if isinstance(data, dict) else None
         if isinstance(size_info, dict):
@@ -7548,7 +8272,11 @@ th {{ background-color: {table_head_bg}; }}
             if getattr(self, "_initial_file", None):
                 self._last_session_file = last_file
             else:
-                self._open_file_path(last_file, notify_errors=False, show_status=False)
+                # Posted to the event queue rather than opened inline: the
+                # window paints its first frame immediately and the file
+                # streams in behind it instead of delaying startup.
+                self.status.showMessage("Loading…")
+                QTimer.singleShot(0, lambda: self._restore_last_file(last_file))
 
         self._settings_cache = data
         # Start the autosave timer now so recovery writes fire even for brand-new
@@ -7617,6 +8345,7 @@ th {{ background-color: {table_head_bg}; }}
                 "last_opened_file": last_opened_file,
                 "reopen_last_file_on_launch": self._restore_last_session,
                 "update_check_on_launch": getattr(self, '_update_check_on_launch', True),
+                "validate_urls_online": getattr(self, '_validate_urls_online', True),
                 "markdown_preview_visible": bool(getattr(self, '_markdown_preview_visible', False)),
                 "markdown_preview_split": list(getattr(self, '_preview_split_sizes', []) or []),
                 "appearance_theme_mode": self._normalize_theme_mode(
@@ -7693,15 +8422,21 @@ th {{ background-color: {table_head_bg}; }}
         be taken the merge still runs, since a merged write is strictly better
         than the whole-snapshot write it replaces.
         """
+        changed = {
+            key: value for key, value in data.items()
+            if key not in self._settings_cache or self._settings_cache[key] != value
+        }
+        if not changed:
+            # Nothing differs from what this window last read or wrote, so the
+            # disk round-trip (lock, full JSON decode, full encode + atomic
+            # replace) buys nothing.  Closing an untouched window, or toggling
+            # a setting back to its stored value, now costs no I/O at all.
+            return True, self._settings_cache
         lock = self.settings.lock()
         locked = False
         try:
             locked = lock.tryLock(2000)
             disk = self.settings.read_current()
-            changed = {
-                key: value for key, value in data.items()
-                if key not in self._settings_cache or self._settings_cache[key] != value
-            }
             merged = dict(disk)
             # Keys this window changed win; keys it never knew about (written by a
             # newer version, or by another window) are preserved untouched.
@@ -7875,7 +8610,7 @@ th {{ background-color: {table_head_bg}; }}
         filesystem.  Copying rather than moving, on the same reasoning as the
         settings migration: copying is reversible, deleting is not.
         """
-        home = Path.home()
+        home = _HOME
         docs = home / "Documents" / Notepad.USER_DOCUMENTS_DIR_NAME
         try:
             docs.mkdir(parents=True, exist_ok=True)
@@ -7949,13 +8684,10 @@ th {{ background-color: {table_head_bg}; }}
                                     merged[k] = self._settings_cache[k]
                             self._apply_settings_dict(merged)
                             self._settings_cache = merged
-                            _interval = self._autosave_interval_minutes
-                            if _interval > 0:
-                                self.autosave_timer.start(_interval * 60 * 1000)
-                                self.autosave_enabled = True
+                            if self._autosave_interval_minutes > 0:
+                                self._start_autosave()
                             else:
-                                self.autosave_timer.stop()
-                                self.autosave_enabled = False
+                                self._stop_autosave()
                             self._save_preferences()
                             self._update_status_bar()
                             self.status.showMessage(
@@ -8036,8 +8768,7 @@ th {{ background-color: {table_head_bg}; }}
         # ── 5. Auto-save ─────────────────────────────────────────────────────
         self._autosave_interval_minutes = 2
         self._update_autosave_menu(2)
-        self.autosave_timer.start(2 * 60 * 1000)
-        self.autosave_enabled = True
+        self._start_autosave()
 
         # ── 6. Word wrap ─────────────────────────────────────────────────────
         self.editor.setWordWrap(True)
@@ -8177,13 +8908,10 @@ th {{ background-color: {table_head_bg}; }}
                                     merged[k] = self._settings_cache[k]
                             self._apply_settings_dict(merged)
                             self._settings_cache = merged
-                            _interval = self._autosave_interval_minutes
-                            if _interval > 0:
-                                self.autosave_timer.start(_interval * 60 * 1000)
-                                self.autosave_enabled = True
+                            if self._autosave_interval_minutes > 0:
+                                self._start_autosave()
                             else:
-                                self.autosave_timer.stop()
-                                self.autosave_enabled = False
+                                self._stop_autosave()
                             self._save_preferences()
                             self._update_status_bar()
                             self.status.showMessage(
@@ -8253,8 +8981,7 @@ th {{ background-color: {table_head_bg}; }}
         # ── 5. Auto-save ─────────────────────────────────────────────────────
         self._autosave_interval_minutes = 2
         self._update_autosave_menu(2)
-        self.autosave_timer.start(2 * 60 * 1000)
-        self.autosave_enabled = True
+        self._start_autosave()
 
         # ── 6. Word wrap ─────────────────────────────────────────────────────
         self.editor.setWordWrap(True)
@@ -8345,6 +9072,10 @@ th {{ background-color: {table_head_bg}; }}
         dlg.setStyleSheet(self._make_dialog_stylesheet())
         if dlg.exec():
             font = dlg.selectedFont()
+            if font == current_font:
+                # Accepting the dialog with the current font unchanged: skip
+                # the editor re-layout and the preferences write.
+                return
             self.editor.setFont(font)
             self._save_preferences()
             self.status.showMessage(f"Font: {font.family()} {font.pointSize()}pt", 1500)
@@ -8456,10 +9187,14 @@ th {{ background-color: {table_head_bg}; }}
         self.word_index_act.toggle()
 
     def _toggle_wrap(self, enabled: bool):
+        if bool(enabled) == self.editor.isWordWrap():
+            return
         self.editor.setWordWrap(bool(enabled))
         self._save_preferences()
 
     def _toggle_line_numbers(self, enabled: bool):
+        if bool(enabled) == self.editor.isLineNumbersVisible():
+            return
         self.editor.setLineNumbersVisible(bool(enabled))
         self._save_preferences()
 
@@ -8529,20 +9264,33 @@ th {{ background-color: {table_head_bg}; }}
     def _update_default_directory(self, directory: Path | str):
         if directory is None:
             return
+        # Every manual save arrives here with the same parent directory as the
+        # last one; comparing the raw fspath against the previous argument
+        # bails out before any Path construction or filesystem stat.
+        try:
+            incoming = os.fspath(directory)
+        except TypeError:
+            return
+        if incoming == self._last_default_dir_arg:
+            return
         try:
-            candidate = Path(directory)
+            candidate = Path(incoming)
         except Exception:
             return
+        current = getattr(self, "default_directory", None)
+        if current is not None and str(candidate) == str(current):
+            self._last_default_dir_arg = incoming
+            return
         if candidate.is_file():
             candidate = candidate.parent
         try:
             candidate = candidate.expanduser()
         except Exception:
             pass
-        if getattr(self, "default_directory", None) is not None:
-            if str(candidate) == str(self.default_directory):
-                self.default_directory = candidate
-                return
+        self._last_default_dir_arg = incoming
+        if current is not None and str(candidate) == str(current):
+            self.default_directory = candidate
+            return
         self.default_directory = candidate
         self._save_preferences()
 
@@ -8555,23 +9303,33 @@ th {{ background-color: {table_head_bg}; }}
         self._update_autosave_menu(minutes)
         
         if minutes > 0:
-            self.autosave_timer.start(minutes * 60 * 1000)
-            self.autosave_enabled = True
+            self._start_autosave()
             self.status.showMessage(f"Auto-save enabled ({minutes} min)", 2000)
         else:
             self._stop_autosave()
             self.status.showMessage("Auto-save disabled", 2000)
 
     def _update_autosave_menu(self, minutes: int):
-        self.autosave_disabled_act.setChecked(minutes == 0)
-        self.autosave_2min_act.setChecked(minutes == 2)
-        self.autosave_5min_act.setChecked(minutes == 5)
-        self.autosave_15min_act.setChecked(minutes == 15)
-        self.autosave_30min_act.setChecked(minutes == 30)
+        # One setChecked on the matching action; the exclusive QActionGroup
+        # unchecks the previous one in C++, so at most two actions change
+        # state instead of five unconditional setChecked calls.
+        act = self._autosave_actions.get(minutes)
+        if act is not None:
+            act.setChecked(True)
 
     def _search_web_shortcut(self):
         cursor = self.editor.textCursor()
         if cursor.hasSelection():
+            start = cursor.selectionStart()
+            # Normalisation keeps at most _SEARCH_QUERY_MAX_CHARS anyway, so
+            # clip an oversized (usually accidental, e.g. Select All) selection
+            # before selectedText() materialises megabytes of it.
+            if cursor.selectionEnd() - start > CodeEditor._SEARCH_QUERY_MAX_CHARS:
+                cursor.setPosition(start)
+                cursor.setPosition(
+                    start + CodeEditor._SEARCH_QUERY_MAX_CHARS,
+                    QTextCursor.KeepAnchor,
+                )
             text = cursor.selectedText()
         else:
             cursor.select(QTextCursor.WordUnderCursor)
@@ -8615,7 +9373,7 @@ th {{ background-color: {table_head_bg}; }}
         has_selection = cursor.hasSelection()
 
         if has_selection:
-            original = cursor.selectedText().replace("\u2029", "\n")
+            original = _map_qt_line_seps(cursor.selectedText())
         else:
             original = self.editor.documentText()
 
@@ -8700,9 +9458,16 @@ th {{ background-color: {table_head_bg}; }}
         return True
 
     def _update_title(self, *_):
-        name = "Untitled" if self.current_path is None else QFileInfo(self.current_path).fileName()
+        # os.path.basename instead of QFileInfo: no Qt object construction for
+        # a pure string split, on a slot wired to every modification toggle.
+        name = "Untitled" if self.current_path is None else os.path.basename(self.current_path)
         modified = "*" if self.editor.document().isModified() else ""
-        self.setWindowTitle(f"{name}{modified} - Neight")
+        title = f"{name}{modified} - Neight"
+        # setWindowTitle is a window-manager round trip on Windows; skip it
+        # when nothing changed (several paths call this after save/open).
+        if title != self._last_title:
+            self._last_title = title
+            self.setWindowTitle(title)
 
     def _on_preview_splitter_moved(self, _pos: int, _index: int) -> None:
         """Remember a divider the user dragged, and persist it when they settle."""
@@ -8738,6 +9503,22 @@ th {{ background-color: {table_head_bg}; }}
         # from 10+ toPlainText() calls/sec down to ≤4.
         self._status_update_timer.start(250)
 
+    def _invalidate_plain_cache(self):
+        self._plain_cache = None
+
+    def _plain_text(self) -> str:
+        """The editor's toPlainText(), memoized until the next edit.
+
+        Within one quiet period the status refresh, the preview re-render and
+        a PDF export may each want the full document; the memo means only the
+        first of them pays the O(N) copy.  Callers that must preserve exotic
+        characters on disk keep using editor.documentText() — toPlainText()
+        substitutes ASCII lookalikes (NBSP becomes a plain space).
+        """
+        if self._plain_cache is None:
+            self._plain_cache = self.editor.toPlainText()
+        return self._plain_cache
+
     def _schedule_word_highlight_update(self):
         self._word_highlight_timer.start()
 
@@ -8889,8 +9670,8 @@ th {{ background-color: {table_head_bg}; }}
         if not text or not text.strip():
             return 0
 
-        chunks = re.split(r"[.!?\u0964\u0965\u3002\uff01\uff1f\u061f]+", text)
-        return sum(1 for chunk in chunks if re.search(r"\S", chunk))
+        chunks = _SENTENCE_END_RE.split(text)
+        return sum(1 for chunk in chunks if _NON_WS_RE.search(chunk))
 
     @staticmethod
     def _is_word_char(ch: str) -> bool:
@@ -8934,29 +9715,51 @@ th {{ background-color: {table_head_bg}; }}
     def _extract_word_tokens(cls, text: str) -> list[str]:
         return [text[start:end] for start, end in cls._extract_word_spans(text)]
 
-    def _update_reading_time_status(self, text: str, tokens: Optional[list[str]] = None):
+    def _block_word_stats(self) -> tuple[int, int, int, int]:
+        """Word and script tallies for the whole document, one block at a time.
+
+        Each block carries its tallies in a _BlockCounts user-data object
+        stamped with the block revision it was computed from, so only blocks
+        the last edit touched are retokenised; untouched blocks contribute
+        their cached integers.  Words never span a block boundary (newline is
+        neither a word character nor a connector), so the per-block sums equal
+        the whole-text count.
+
+        Returns (words, tamil, english, other).
+        """
+        total = tamil = english = other = 0
+        block = self.editor.document().firstBlock()
+        while block.isValid():
+            data = block.userData()
+            if not isinstance(data, _BlockCounts) or data.revision != block.revision():
+                tokens = self._extract_word_tokens(block.text())
+                t = e = o = 0
+                for token in tokens:
+                    script = self._classify_word_script(token)
+                    if script == "tamil":
+                        t += 1
+                    elif script == "english":
+                        e += 1
+                    else:
+                        o += 1
+                data = _BlockCounts(block.revision(), len(tokens), t, e, o)
+                block.setUserData(data)
+            total += data.words
+            tamil += data.tamil
+            english += data.english
+            other += data.other
+            block = block.next()
+        return total, tamil, english, other
+
+    def _update_reading_time_status(self, tamil_words: int, english_words: int, other_words: int):
         if not getattr(self, "_reading_time_enabled", False):
             self.reading_time_label.setText("")
             return
 
-        if tokens is None:
-            tokens = self._extract_word_tokens(text)
-        if not tokens:
+        if not (tamil_words or english_words or other_words):
             self.reading_time_label.setText("Read: <1 min")
             return
 
-        tamil_words = 0
-        english_words = 0
-        other_words = 0
-        for token in tokens:
-            script = self._classify_word_script(token)
-            if script == "tamil":
-                tamil_words += 1
-            elif script == "english":
-                english_words += 1
-            else:
-                other_words += 1
-
         tamil_wpm = max(1, self._normalize_reading_speed(getattr(self, "_tamil_reading_wpm", 150), 150))
         english_wpm = max(1, self._normalize_reading_speed(getattr(self, "_english_reading_wpm", 250), 250))
         other_wpm = 180
@@ -8966,7 +9769,7 @@ th {{ background-color: {table_head_bg}; }}
             (english_words / english_wpm) +
             (other_words / other_wpm)
         )
-        total_words = max(1, len(tokens))
+        total_words = max(1, tamil_words + english_words + other_words)
         tamil_pct = int(round((tamil_words * 100.0) / total_words))
         english_pct = int(round((english_words * 100.0) / total_words))
 
@@ -8982,20 +9785,25 @@ th {{ background-color: {table_head_bg}; }}
         show_sentences = getattr(self, "_status_show_sentences", True)
         show_chars = getattr(self, "_status_show_chars", True)
         reading_time = getattr(self, "_reading_time_enabled", False)
-        # Skip the O(n) toPlainText() copy entirely when nothing needs the document text.
-        if not show_words and not show_sentences and not show_chars and not reading_time:
-            self._update_cursor_position_status()
-            return
-        text = self.editor.toPlainText()
-        need_tokens = show_words or reading_time
-        tokens = self._extract_word_tokens(text) if need_tokens else []
-        if show_words:
-            self.words_label.setText(f"Words: {len(tokens)}")
+        # Word and reading-time tallies come from the per-block cache, so an
+        # edit retokenises only the blocks it touched; the character count is
+        # O(1) from the document.  Only the sentence counter still needs the
+        # full text — sentences can span block boundaries, so per-block sums
+        # would overcount — and the O(n) toPlainText() copy is paid only when
+        # that counter is visible.
+        if show_words or reading_time:
+            words, tamil, english, other = self._block_word_stats()
+            if show_words:
+                self.words_label.setText(f"Words: {words}")
+            self._update_reading_time_status(tamil, english, other)
+        else:
+            self._update_reading_time_status(0, 0, 0)
         if show_sentences:
+            text = self._plain_text()
             self.sentences_label.setText(f"Sentences: {self._count_sentences(text)}")
         if show_chars:
-            self.chars_label.setText(f"Chars: {len(text)}")
-        self._update_reading_time_status(text, tokens=tokens if need_tokens else None)
+            # characterCount() includes the final paragraph separator.
+            self.chars_label.setText(f"Chars: {self.editor.document().characterCount() - 1}")
         self._update_cursor_position_status()
 
     # Confirm close with save prompt and persist settings
@@ -9004,8 +9812,9 @@ th {{ background-color: {table_head_bg}; }}
             self._clear_recovery_file()
             if not getattr(self, '_settings_reset_pending', False):
                 self._save_preferences()
-            # Stop any in-flight update-check threads so the process exits cleanly.
-            for _worker_attr in ("_startup_update_worker", "_update_worker"):
+            # Stop any in-flight worker threads so the process exits cleanly.
+            for _worker_attr in ("_startup_update_worker", "_update_worker",
+                                 "_pdf_export_worker"):
                 _worker = getattr(self, _worker_attr, None)
                 if _worker is not None and _worker.isRunning():
                     _worker.quit()